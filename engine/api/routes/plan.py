@@ -23,7 +23,11 @@ def _decode_base64_image(base64_str: str) -> Image.Image:
     """Decode a base64 string to PIL Image."""
     try:
         image_data = base64.b64decode(base64_str)
-        return Image.open(BytesIO(image_data)).convert("RGB")
+        img = Image.open(BytesIO(image_data))
+        # Planning downscales to ~1280px anyway; draft() lets libjpeg
+        # decode 4K JPEG uploads at reduced scale directly (no-op for PNG)
+        img.draft("RGB", (1280, 1280))
+        return img.convert("RGB")
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid base64 image: {str(e)}")
 
@@ -48,8 +52,9 @@ async def generate_plan(
         else:
             img = take_screenshot()
 
-        # Generate plan
-        plan = planner.generate_plan(
+        # Generate plan (async client - the Gemini round trip and any
+        # retry backoff must not block the event loop)
+        plan = await planner.generate_plan_async(
             img=img,
             task=request.task,
             max_steps=request.max_steps,
@@ -66,10 +66,24 @@ def _encode_image_base64(img: Image.Image) -> str:
     return base64.b64encode(buffer.getvalue()).decode("utf-8")
 
 
+# orjson encodes step arrays and base64 highlight payloads several times
+# faster than the stdlib encoder behind send_json; optional dependency
+try:
+    import orjson
+
+    def _encode_event(event: dict) -> str:
+        return orjson.dumps(event).decode()
+
+except ImportError:
+
+    def _encode_event(event: dict) -> str:
+        return json.dumps(event)
+
+
 async def send_event(websocket: WebSocket, event_type: EventType, data: dict = None):
     """Send a typed event to the client."""
     event = {"type": event_type.value, "data": data or {}}
-    await websocket.send_json(event)
+    await websocket.send_text(_encode_event(event))
 
 
 @router.websocket("/ws/run")
@@ -120,15 +134,25 @@ async def websocket_task_runner(websocket: WebSocket):
         planner = get_cached_planner()
         locator = get_cached_locator()
 
-        # Take initial screenshot
+        # Kick off planning immediately so the Gemini round trip overlaps
+        # with the status event going out; the async client keeps the
+        # event loop free for other connections while it waits
+        try:
+            img = take_screenshot()
+            plan_task = asyncio.create_task(planner.generate_plan_async(img, task))
+        except Exception as e:
+            await send_event(websocket, EventType.PLAN_ERROR, {
+                "error": str(e)
+            })
+            return
+
         await send_event(websocket, EventType.PLAN_STARTED, {
             "task": task,
             "message": "Taking screenshot and generating plan..."
         })
 
         try:
-            img = take_screenshot()
-            plan = planner.generate_plan(img, task)
+            plan = await plan_task
         except Exception as e:
             await send_event(websocket, EventType.PLAN_ERROR, {
                 "error": str(e)
@@ -3,5 +3,6 @@ Caching utilities.
 """
 
 from engine.cache.ocr_cache import OCRCache, get_ocr_cache
+from engine.cache.llm_cache import LLMCache, get_llm_cache
 
-__all__ = ["OCRCache", "get_ocr_cache"]
+__all__ = ["OCRCache", "get_ocr_cache", "LLMCache", "get_llm_cache"]
@@ -0,0 +1,125 @@
+"""
+Exact-match cache for raw Gemini responses, persisted across runs.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+
+class LLMCache:
+    """
+    LRU cache for raw model responses keyed by the exact request payload.
+
+    The key digests (prompt, image bytes, model name), so a hit is
+    guaranteed to be the answer Gemini already gave for this precise
+    request - no staleness heuristics needed. Entries survive process
+    restarts via a JSON file written at shutdown, which makes replayed
+    sessions (demo runs, test loops) free after the first pass.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256,
+        path: Optional[str] = None,
+        persist: bool = True,
+    ):
+        self.max_size = max_size
+        self.path = Path(path) if path else Path("data") / "llm_cache.json"
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._dirty = False
+
+        if persist:
+            self._load()
+            atexit.register(self.save)
+
+    @staticmethod
+    def compute_key(prompt: str, image_bytes: bytes, model_name: str) -> str:
+        """Digest the exact request payload into a cache key."""
+        h = hashlib.sha256()
+        h.update(prompt.encode("utf-8"))
+        h.update(image_bytes)
+        h.update(model_name.encode("utf-8"))
+        return h.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for a key, or None."""
+        text = self._cache.get(key)
+        if text is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._cache.move_to_end(key)
+        return text
+
+    def put(self, key: str, response_text: str) -> None:
+        """Cache a response, evicting the least recently used on overflow."""
+        self._cache[key] = response_text
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        self._dirty = True
+
+    def _load(self) -> None:
+        """Load persisted entries; a missing or corrupt file is a cold start."""
+        try:
+            with open(self.path) as f:
+                entries = json.load(f)
+            if isinstance(entries, dict):
+                self._cache.update(entries)
+        except (OSError, ValueError):
+            pass
+
+    def save(self) -> None:
+        """Persist entries to disk (atomic rename so a crash can't corrupt)."""
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(
+                dir=self.path.parent, prefix=self.path.name, suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(dict(self._cache), f)
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        """Clear the cache."""
+        self._cache.clear()
+        self._hits = 0
+        self._misses = 0
+        self._dirty = True
+
+    @property
+    def stats(self) -> dict:
+        """Get cache statistics."""
+        total = self._hits + self._misses
+        return {
+            "size": len(self._cache),
+            "max_size": self.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total > 0 else 0,
+        }
+
+
+# Global cache instance
+_global_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache(max_size: int = 256) -> LLMCache:
+    """Get or create the global LLM response cache."""
+    global _global_cache
+    if _global_cache is None:
+        _global_cache = LLMCache(max_size=max_size)
+    return _global_cache
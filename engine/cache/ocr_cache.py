@@ -3,9 +3,10 @@ LRU cache for OCR results using image hashing.
 """
 
 import hashlib
+import threading
 from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Dict, Optional, List, Any
+from typing import Dict, Optional, List, Any, Tuple
 from PIL import Image
 import io
 
@@ -16,79 +17,142 @@ class OCRCacheEntry:
     image_hash: str
     ocr_data: Dict[str, Any]
     all_text: List[str]  # All detected text for suggestions
+    text_lower: Optional[List[str]] = None  # Pre-lowered text column for matching
 
 
 class OCRCache:
     """
-    LRU cache for OCR results.
-
-    Uses perceptual hashing to identify similar images.
+    Cache for OCR results, keyed by a perceptual image hash.
+
+    Supports two eviction policies:
+    - "lfu" (default): counter-based, evicts the least-frequently-hit
+      entry. A planner scanning many one-shot crops of one screenshot
+      would thrash an LRU cache; frequency counts keep the hot frames
+      resident. Counters saturate at 255 and are halved globally on
+      saturation so stale popularity ages out.
+    - "lru": classic recency order.
     """
 
-    def __init__(self, max_size: int = 100):
+    _COUNT_MAX = 255
+
+    def __init__(self, max_size: int = 100, policy: str = "lfu"):
         self.max_size = max_size
+        self.policy = policy
         self._cache: OrderedDict[str, OCRCacheEntry] = OrderedDict()
+        self._counts: Dict[str, int] = {}
+        self._key_memo: Dict[int, Tuple[Image.Image, str]] = {}
         self._hits = 0
         self._misses = 0
-
-    def _compute_hash(self, img: Image.Image) -> str:
+        # locate_many and the async batch paths hit this cache from
+        # worker threads; the LFU eviction and saturation rescale iterate
+        # the dicts, so unguarded concurrent puts would blow up with
+        # "dictionary changed size during iteration". The ops are
+        # microseconds - negligible contention next to an OCR pass.
+        self._lock = threading.Lock()
+
+    def compute_key(self, img: Image.Image) -> str:
         """
-        Compute a hash for an image.
-
-        Uses a simple approach: resize to small size and hash pixels.
+        Compute a cache key for an image.
+
+        32x32 grayscale tile-average (BOX resampling) hashed with blake2b -
+        the reduction is a single area-average pass instead of a full
+        Lanczos filter, and the digest sees 1KB instead of megapixels.
+        The averaging also makes screenshots that differ only by a few
+        pixels (cursor position, blinking caret) land on the same key.
+        Keys are memoized by object identity so repeated lookups against
+        the same live image skip even the reduction. The entry pins the
+        image: CPython recycles addresses, so without a strong reference
+        (and an identity check on hit) a freed image's id could alias a
+        new one and serve the wrong key.
         """
-        # Resize to 16x16 grayscale for hashing
-        small = img.convert("L").resize((16, 16), Image.Resampling.LANCZOS)
-
-        # Get pixel data and hash it
-        pixels = list(small.getdata())
-        pixel_bytes = bytes(pixels)
-        return hashlib.md5(pixel_bytes).hexdigest()
-
-    def get(self, img: Image.Image) -> Optional[OCRCacheEntry]:
+        memo = self._key_memo.get(id(img))
+        if memo is not None and memo[0] is img:
+            return memo[1]
+
+        small = img.convert("L").resize((32, 32), Image.Resampling.BOX)
+        key = hashlib.blake2b(small.tobytes(), digest_size=16).hexdigest()
+
+        # Bounded like the locator's preprocess memo - it only needs to
+        # cover one screenshot batch
+        if len(self._key_memo) >= 8:
+            self._key_memo.clear()
+        self._key_memo[id(img)] = (img, key)
+        return key
+
+    def get(
+        self, img: Image.Image, img_hash: Optional[str] = None
+    ) -> Optional[OCRCacheEntry]:
         """
         Get cached OCR result for an image.
 
-        Returns None if not cached.
+        Pass `img_hash` (from compute_key) to skip re-hashing when the
+        caller already holds the key. Returns None if not cached.
         """
-        img_hash = self._compute_hash(img)
-
-        if img_hash in self._cache:
-            self._hits += 1
-            # Move to end (most recently used)
-            self._cache.move_to_end(img_hash)
-            return self._cache[img_hash]
-
-        self._misses += 1
-        return None
+        if img_hash is None:
+            img_hash = self.compute_key(img)
+
+        with self._lock:
+            # Single hash lookup instead of membership test plus re-index
+            entry = self._cache.get(img_hash)
+            if entry is not None:
+                self._hits += 1
+                # Move to end (most recently used)
+                self._cache.move_to_end(img_hash)
+                count = self._counts.get(img_hash, 0) + 1
+                if count >= self._COUNT_MAX:
+                    # Age every counter so long-dead hot spots decay
+                    self._counts = {k: v >> 1 for k, v in self._counts.items()}
+                    count >>= 1
+                self._counts[img_hash] = count
+                return entry
+
+            self._misses += 1
+            return None
 
     def put(
-        self, img: Image.Image, ocr_data: Dict[str, Any], all_text: List[str]
+        self,
+        img: Image.Image,
+        ocr_data: Dict[str, Any],
+        all_text: List[str],
+        text_lower: Optional[List[str]] = None,
+        img_hash: Optional[str] = None,
     ) -> str:
         """
         Cache OCR result for an image.
 
         Returns the image hash.
         """
-        img_hash = self._compute_hash(img)
-
-        # Remove oldest if at capacity
-        if len(self._cache) >= self.max_size:
-            self._cache.popitem(last=False)
-
-        entry = OCRCacheEntry(
-            image_hash=img_hash,
-            ocr_data=ocr_data,
-            all_text=all_text,
-        )
-        self._cache[img_hash] = entry
+        if img_hash is None:
+            img_hash = self.compute_key(img)
+
+        with self._lock:
+            # Evict if at capacity
+            if len(self._cache) >= self.max_size and img_hash not in self._cache:
+                if self.policy == "lfu":
+                    victim = min(self._cache, key=lambda k: self._counts.get(k, 0))
+                    del self._cache[victim]
+                else:
+                    victim, _ = self._cache.popitem(last=False)
+                self._counts.pop(victim, None)
+
+            entry = OCRCacheEntry(
+                image_hash=img_hash,
+                ocr_data=ocr_data,
+                all_text=all_text,
+                text_lower=text_lower,
+            )
+            self._cache[img_hash] = entry
+            self._counts[img_hash] = self._counts.get(img_hash, 0) + 1
         return img_hash
 
     def clear(self) -> None:
         """Clear the cache."""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._counts.clear()
+            self._key_memo.clear()
+            self._hits = 0
+            self._misses = 0
 
     @property
     def stats(self) -> Dict[str, Any]:
@@ -108,9 +172,9 @@ class OCRCache:
 _global_cache: Optional[OCRCache] = None
 
 
-def get_ocr_cache(max_size: int = 100) -> OCRCache:
+def get_ocr_cache(max_size: int = 100, policy: str = "lfu") -> OCRCache:
     """Get or create the global OCR cache."""
     global _global_cache
     if _global_cache is None:
-        _global_cache = OCRCache(max_size=max_size)
+        _global_cache = OCRCache(max_size=max_size, policy=policy)
     return _global_cache
@@ -289,7 +289,11 @@ def cmd_locate(args):
 
 def cmd_plan(args):
     """Generate a plan without executing."""
-    img = Image.open(args.image).convert("RGB")
+    from engine.utils.image import open_for_api
+
+    # Planning never needs full resolution - draft-decode large JPEGs at
+    # reduced scale instead of decoding 4K and resizing afterwards
+    img = open_for_api(args.image, max_width=1280)
     task = args.task
 
     print(f"Image: {img.size[0]}x{img.size[1]}")
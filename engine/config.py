@@ -17,6 +17,7 @@ class Config:
 
     # OCR Settings
     ocr_cache_size: int = 100
+    ocr_cache_policy: str = "lfu"  # "lfu" keeps hot screenshots under scans; "lru" for pure recency
     ocr_fuzzy_threshold: float = 0.8
 
     # Retry Settings
@@ -29,6 +30,18 @@ class Config:
     gemini_fast_model: str = "gemini-2.0-flash"   # Fast model for QA/validation
     plan_max_steps: int = 8
 
+    # Result verification: trust above, reject below, only ask Gemini between
+    verify_trust_threshold: int = 75
+    verify_reject_threshold: int = 20
+
+    # Send standalone visibility checks as small grayscale JPEGs - color
+    # carries no signal for "is this text visible?"
+    validate_grayscale: bool = True
+
+    # Build Gemini model handles eagerly at construction instead of on the
+    # first locate, moving SDK setup cost out of the first user request
+    warmup: bool = False
+
     # Icon Detection
     icon_confidence_threshold: float = 0.3
     icon_max_candidates: int = 10
@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, List
 
+import numpy as np
+
 
 class LocatorMethod(Enum):
     """Method used to locate an element."""
@@ -14,7 +16,7 @@ class LocatorMethod(Enum):
     HYBRID = "hybrid"
 
 
-@dataclass
+@dataclass(slots=True)
 class BoundingBox:
     """Pixel-coordinate bounding box."""
     x1: int
@@ -66,6 +68,24 @@ class BoundingBox:
             y2=min(height, self.y2),
         )
 
+    @staticmethod
+    def batch_expand_clamp(
+        boxes: "np.ndarray", padding: int, width: int, height: int
+    ) -> "np.ndarray":
+        """
+        expand(padding).clamp(width, height) over an (N, 4) coordinate array.
+
+        One vectorized pass instead of 2N BoundingBox allocations - callers
+        that crop many candidate regions should stack coordinates and use
+        this, constructing BoundingBox objects only for rows they keep.
+        """
+        out = boxes + np.array([-padding, -padding, padding, padding])
+        np.clip(out[:, 0], 0, width, out=out[:, 0])
+        np.clip(out[:, 1], 0, height, out=out[:, 1])
+        np.clip(out[:, 2], 0, width, out=out[:, 2])
+        np.clip(out[:, 3], 0, height, out=out[:, 3])
+        return out
+
 
 @dataclass
 class LocatorResult:
@@ -2,17 +2,21 @@
 Hybrid locator that orchestrates OCR and icon detection.
 """
 
+import asyncio
+import json
+import re
 import time
+from collections import OrderedDict
 from typing import Optional, List
 from PIL import Image
-import google.generativeai as genai
 
 from engine.core.types import LocatorResult, LocatorMethod, BoundingBox
 from engine.core.regions import RegionManager, get_region_manager
 from engine.core.exceptions import ElementNotFoundError
 from engine.locators.base import BaseLocator
 from engine.locators.ocr_locator import OCRLocator
-from engine.locators.icon_locator import IconLocator
+from engine.locators.icon_locator import IconLocator, _load_genai
+from engine.utils.image import jpeg_part_for_api
 from engine.utils.retry import with_retry, RetryConfig
 from engine.config import Config, get_config
 
@@ -28,7 +32,7 @@ RULES for picking the correct element:
 3. When in doubt, prefer the element that appears HIGHER on screen (main options are usually at the top)
 4. Pick the one that DIRECTLY accomplishes the user's stated goal
 
-Reply with just the number (1, 2, 3...) or "0" if none are correct.'''
+Reply with the number of the correct element (1, 2, 3...) or 0 if none are correct.'''
 
 
 VERIFY_SINGLE_PROMPT = '''The user wants to: "{instruction}"
@@ -44,6 +48,26 @@ Is this the CORRECT element to click? Check:
 Reply YES or NO only.'''
 
 
+# Compiled once - extracts the first digit from a Gemini pick response
+# (fallback path when structured output fails to parse)
+_FIRST_DIGIT_RE = re.compile(r"[0-9]")
+
+
+# Structured-output schemas so Gemini returns machine-parseable JSON
+# instead of free-form text (fewer output tokens, deterministic parsing)
+VERIFY_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {"verdict": {"type": "string", "enum": ["YES", "NO"]}},
+    "required": ["verdict"],
+}
+
+PICK_RESPONSE_SCHEMA = {
+    "type": "object",
+    "properties": {"pick": {"type": "integer"}},
+    "required": ["pick"],
+}
+
+
 class HybridLocator(BaseLocator):
     """
     Orchestrates OCR and icon detection with fallback logic.
@@ -66,10 +90,35 @@ class HybridLocator(BaseLocator):
         self.ocr = ocr_locator or OCRLocator(self.config, region_manager=self.regions)
         self.icon = icon_locator or IconLocator(self.config, region_manager=self.regions)
         self._verify_model = None
+        self._pick_model = None
+
+        # Memoizes annotated+encoded verification images so verify + pick
+        # on the same matches don't re-draw and re-encode the buffer.
+        # Bounded LRU (each entry holds a ~100-300 KB JPEG) because the
+        # API server calls single locate() on a long-lived singleton and
+        # never hits the batch-entry clears; entries pin the screenshot
+        # so a recycled id can't alias a previous frame
+        self._annotation_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._annotation_cache_size = 8
+
+        # Build the retry config and wrapped locate callables once, so the
+        # hot path doesn't allocate a decorator + closure on every call
+        self._retry_config = RetryConfig(
+            max_attempts=self.config.max_retries,
+            base_delay=self.config.retry_base_delay,
+            max_delay=self.config.retry_max_delay,
+        )
+        self._ocr_locate = with_retry(self._retry_config)(self.ocr.locate)
+        self._icon_locate = with_retry(self._retry_config)(self.icon.locate)
 
-        # Configure Gemini
+        # Configure Gemini (deferred SDK import - see icon_locator)
         if self.config.google_api_key:
-            genai.configure(api_key=self.config.google_api_key)
+            _load_genai(self.config.google_api_key)
+
+            # Pay model-handle setup now rather than inside the first locate
+            if self.config.warmup:
+                _ = self.verify_model
+                _ = self.pick_model
 
         # Track statistics
         self._stats = {
@@ -79,15 +128,45 @@ class HybridLocator(BaseLocator):
             "icon_successes": 0,
             "fallbacks": 0,
             "verifications": 0,
+            "verify_skipped": 0,
         }
 
     @property
     def verify_model(self):
-        """Lazy-load fast Gemini model for verification."""
+        """Lazy-load fast Gemini model for YES/NO verification (structured output)."""
         if self._verify_model is None:
-            self._verify_model = genai.GenerativeModel(self.config.gemini_fast_model)
+            self._verify_model = _load_genai(self.config.google_api_key).GenerativeModel(
+                self.config.gemini_fast_model,
+                generation_config={
+                    "response_mime_type": "application/json",
+                    "response_schema": VERIFY_RESPONSE_SCHEMA,
+                },
+            )
         return self._verify_model
 
+    @property
+    def pick_model(self):
+        """Lazy-load fast Gemini model for multi-match picking (structured output)."""
+        if self._pick_model is None:
+            self._pick_model = _load_genai(self.config.google_api_key).GenerativeModel(
+                self.config.gemini_fast_model,
+                generation_config={
+                    "response_mime_type": "application/json",
+                    "response_schema": PICK_RESPONSE_SCHEMA,
+                },
+            )
+        return self._pick_model
+
+    def _annotation_key(self, img: Image.Image, matches: List[dict]) -> tuple:
+        """Cache key for an annotated image: screenshot identity + match boxes."""
+        return (
+            id(img),
+            tuple(
+                (m["bbox"].x1, m["bbox"].y1, m["bbox"].x2, m["bbox"].y2)
+                for m in matches
+            ),
+        )
+
     def _verify_single_match(
         self,
         img: Image.Image,
@@ -98,36 +177,65 @@ class HybridLocator(BaseLocator):
         """Verify a single match is correct using YES/NO question."""
         from PIL import ImageDraw
 
+        # Local heuristic first: a confident match fully inside the app
+        # window is almost always correct - skip the Gemini round-trip
+        if match.get("confidence", 0) >= 85:
+            try:
+                window = self.regions.get("window")
+                wx1, wy1, wx2, wy2 = window.to_pixels(img.width, img.height)
+                bbox = match["bbox"]
+                if wx1 <= bbox.x1 and wy1 <= bbox.y1 and bbox.x2 <= wx2 and bbox.y2 <= wy2:
+                    self._stats["verify_skipped"] += 1
+                    return True
+            except Exception:
+                pass  # No window region available - fall through to Gemini
+
         try:
-            # Create annotated image with box around the match
-            annotated = img.copy()
-            draw = ImageDraw.Draw(annotated)
-            bbox = match["bbox"]
-
-            # Draw red box
-            draw.rectangle(
-                [bbox.x1, bbox.y1, bbox.x2, bbox.y2],
-                outline="#FF0000",
-                width=4
-            )
+            key = self._annotation_key(img, [match])
+            hit = self._annotation_cache.get(key)
+            if hit is not None and hit[0] is img:
+                self._annotation_cache.move_to_end(key)
+                image_part = hit[1]
+            else:
+                # Create annotated image with box around the match
+                annotated = img.copy()
+                draw = ImageDraw.Draw(annotated)
+                bbox = match["bbox"]
+
+                # Draw red box
+                draw.rectangle(
+                    [bbox.x1, bbox.y1, bbox.x2, bbox.y2],
+                    outline="#FF0000",
+                    width=4
+                )
+
+                # Resize for API - thumbnail resizes in place, so we never
+                # hold a second full-resolution buffer
+                if annotated.width > 1200:
+                    annotated.thumbnail((1200, 10**9), Image.LANCZOS)
 
-            # Resize for API
-            max_width = 1200
-            if annotated.width > max_width:
-                ratio = max_width / annotated.width
-                new_size = (max_width, int(annotated.height * ratio))
-                annotated = annotated.resize(new_size, Image.LANCZOS)
+                # Cache the encoded JPEG part, not the PIL image - a repeat
+                # verification reuses the bytes without re-encoding, and the
+                # SDK would otherwise serialize the image as outsized PNG
+                image_part = jpeg_part_for_api(annotated)
+                self._annotation_cache[key] = (img, image_part)
+                if len(self._annotation_cache) > self._annotation_cache_size:
+                    self._annotation_cache.popitem(last=False)
 
             prompt = VERIFY_SINGLE_PROMPT.format(
                 instruction=instruction,
                 target=target,
             )
 
-            response = self.verify_model.generate_content([prompt, annotated])
-            answer = response.text.strip().upper()
+            response = self.verify_model.generate_content([prompt, image_part])
 
             self._stats["verifications"] += 1
-            return "YES" in answer
+            try:
+                verdict = json.loads(response.text).get("verdict", "")
+            except (json.JSONDecodeError, AttributeError):
+                # Model ignored the schema - fall back to text heuristic
+                verdict = response.text.strip().upper()
+            return "YES" in verdict.upper()
 
         except Exception:
             return True  # Assume correct on error
@@ -152,40 +260,50 @@ class HybridLocator(BaseLocator):
             return None
 
         try:
-            # Sort matches by Y position (top to bottom) so #1 is topmost
-            sorted_matches = sorted(matches, key=lambda m: m["bbox"].y1)
-
-            # Create annotated image with numbered boxes
-            annotated = img.copy()
-            draw = ImageDraw.Draw(annotated)
-
-            colors = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#FF00FF", "#00FFFF"]
-
-            for i, match in enumerate(sorted_matches):
-                bbox = match["bbox"]
-                color = colors[i % len(colors)]
-
-                # Draw box
-                draw.rectangle(
-                    [bbox.x1, bbox.y1, bbox.x2, bbox.y2],
-                    outline=color,
-                    width=4
-                )
-
-                # Draw number label
-                label = str(i + 1)
-                draw.rectangle(
-                    [bbox.x1 - 2, bbox.y1 - 25, bbox.x1 + 25, bbox.y1 - 2],
-                    fill=color
-                )
-                draw.text((bbox.x1 + 5, bbox.y1 - 23), label, fill="black")
-
-            # Resize for API
-            max_width = 1200
-            if annotated.width > max_width:
-                ratio = max_width / annotated.width
-                new_size = (max_width, int(annotated.height * ratio))
-                annotated = annotated.resize(new_size, Image.LANCZOS)
+            # OCRLocator guarantees matches arrive sorted top-to-bottom,
+            # so #1 is already the topmost - no re-sort needed
+            sorted_matches = matches
+
+            key = self._annotation_key(img, sorted_matches)
+            hit = self._annotation_cache.get(key)
+            if hit is not None and hit[0] is img:
+                self._annotation_cache.move_to_end(key)
+                image_part = hit[1]
+            else:
+                # Create annotated image with numbered boxes
+                annotated = img.copy()
+                draw = ImageDraw.Draw(annotated)
+
+                colors = ["#FF0000", "#00FF00", "#0000FF", "#FFFF00", "#FF00FF", "#00FFFF"]
+
+                for i, match in enumerate(sorted_matches):
+                    bbox = match["bbox"]
+                    color = colors[i % len(colors)]
+
+                    # Draw box
+                    draw.rectangle(
+                        [bbox.x1, bbox.y1, bbox.x2, bbox.y2],
+                        outline=color,
+                        width=4
+                    )
+
+                    # Draw number label
+                    label = str(i + 1)
+                    draw.rectangle(
+                        [bbox.x1 - 2, bbox.y1 - 25, bbox.x1 + 25, bbox.y1 - 2],
+                        fill=color
+                    )
+                    draw.text((bbox.x1 + 5, bbox.y1 - 23), label, fill="black")
+
+                # Resize for API - thumbnail resizes in place, so we never
+                # hold a second full-resolution buffer
+                if annotated.width > 1200:
+                    annotated.thumbnail((1200, 10**9), Image.LANCZOS)
+
+                image_part = jpeg_part_for_api(annotated)
+                self._annotation_cache[key] = (img, image_part)
+                if len(self._annotation_cache) > self._annotation_cache_size:
+                    self._annotation_cache.popitem(last=False)
 
             prompt = PICK_ELEMENT_PROMPT.format(
                 instruction=instruction,
@@ -193,18 +311,24 @@ class HybridLocator(BaseLocator):
                 target=target,
             )
 
-            response = self.verify_model.generate_content([prompt, annotated])
+            response = self.pick_model.generate_content([prompt, image_part])
             answer = response.text.strip()
 
-            # Extract number from response
+            # Structured output gives {"pick": N}; regex scan as fallback
             self._stats["verifications"] += 1
-            for char in answer:
-                if char.isdigit():
-                    num = int(char)
-                    if num == 0:
-                        return None  # None are correct
-                    if 1 <= num <= len(sorted_matches):
-                        return sorted_matches[num - 1]  # Return the actual match
+            num = None
+            try:
+                num = int(json.loads(answer)["pick"])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                match = _FIRST_DIGIT_RE.search(answer)
+                if match:
+                    num = int(match.group())
+
+            if num is not None:
+                if num == 0:
+                    return None  # None are correct
+                if 1 <= num <= len(sorted_matches):
+                    return sorted_matches[num - 1]  # Return the actual match
 
             return sorted_matches[0]  # Default to first (topmost) match
 
@@ -226,18 +350,8 @@ class HybridLocator(BaseLocator):
         """Attempt OCR location with retry."""
         self._stats["ocr_attempts"] += 1
 
-        retry_config = RetryConfig(
-            max_attempts=self.config.max_retries,
-            base_delay=self.config.retry_base_delay,
-            max_delay=self.config.retry_max_delay,
-        )
-
-        @with_retry(retry_config)
-        def _ocr():
-            return self.ocr.locate(img, target, region, **kwargs)
-
         try:
-            result = _ocr()
+            result = self._ocr_locate(img, target, region, **kwargs)
             if result.found:
                 self._stats["ocr_successes"] += 1
             return result
@@ -250,18 +364,8 @@ class HybridLocator(BaseLocator):
         """Attempt icon location with retry."""
         self._stats["icon_attempts"] += 1
 
-        retry_config = RetryConfig(
-            max_attempts=self.config.max_retries,
-            base_delay=self.config.retry_base_delay,
-            max_delay=self.config.retry_max_delay,
-        )
-
-        @with_retry(retry_config)
-        def _icon():
-            return self.icon.locate(img, target, region, **kwargs)
-
         try:
-            result = _icon()
+            result = self._icon_locate(img, target, region, **kwargs)
             if result.found:
                 self._stats["icon_successes"] += 1
             return result
@@ -430,12 +534,46 @@ class HybridLocator(BaseLocator):
         Returns:
             List of LocatorResults in same order as targets
         """
+        # Fresh per-batch caches - id(img) keys are only safe while the
+        # screenshot object is alive for the whole batch
+        self._annotation_cache.clear()
+        self.ocr.clear_preprocess_cache()
+
         results = []
         for target in targets:
             result = self.locate(img, target, region, **kwargs)
             results.append(result)
         return results
 
+    async def locate_all_async(
+        self,
+        img: Image.Image,
+        targets: List[str],
+        region: str = "full",
+        max_concurrency: int = 5,
+        **kwargs,
+    ) -> List[LocatorResult]:
+        """
+        Find multiple elements concurrently.
+
+        Each locate is dominated by Gemini round-trip latency, so fanning
+        the targets out over worker threads turns N sequential RTTs into
+        roughly one. Results are returned in the same order as targets.
+        """
+        # Fresh per-batch caches, same as locate_all
+        self._annotation_cache.clear()
+        self.ocr.clear_preprocess_cache()
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _locate_one(target: str) -> LocatorResult:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.locate, img, target, region, **kwargs
+                )
+
+        return list(await asyncio.gather(*(_locate_one(t) for t in targets)))
+
     def reset_stats(self) -> None:
         """Reset statistics counters."""
         self._stats = {
@@ -444,4 +582,6 @@ class HybridLocator(BaseLocator):
             "icon_attempts": 0,
             "icon_successes": 0,
             "fallbacks": 0,
+            "verifications": 0,
+            "verify_skipped": 0,
         }
@@ -6,11 +6,17 @@ Gemini to identify which grid cell(s) contain the target icon. This is
 more reliable than asking for raw pixel coordinates.
 """
 
+import functools
+import hashlib
+import io
 import json
+import re
+import threading
 import time
-from typing import Optional, List, Dict, Any, Tuple
-from PIL import Image, ImageDraw, ImageFont
-import google.generativeai as genai
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, NamedTuple, Tuple
+import numpy as np
+from PIL import Image, ImageDraw
 
 from engine.core.types import BoundingBox, LocatorResult, LocatorMethod
 from engine.core.regions import RegionManager, get_region_manager
@@ -55,12 +61,168 @@ ICON PATTERNS:
 - X = close
 
 RESPOND JSON only:
-{{"found": true, "cell": "K3", "description": "brief"}}
+{{"found": true, "cell": "F3", "description": "brief"}}
 {{"found": false, "cell": null, "description": "why"}}
 
 BE PRECISE - return the cell whose CENTER is closest to the icon center.'''
 
 
+# Multi-target variant: one image upload, one answer per target
+ICON_GRID_MANY_PROMPT = '''You are a precise UI element locator. The image has a {cols}x{rows} grid overlay.
+Columns are A-{max_col}, rows are 1-{rows}. Cell "A1" is top-left.
+
+FIND each of these targets:
+{targets_block}
+
+RESPOND with a JSON array only, one object per target IN ORDER:
+[{{"found": true, "cell": "F3", "description": "brief"}},
+ {{"found": false, "cell": null, "description": "why"}}]
+
+BE PRECISE - return the cell whose CENTER is closest to each icon center.'''
+
+
+# Response-parsing patterns, compiled once at import
+_CODEBLOCK_RE = re.compile(r'^```(?:json)?\s*\n|\n```\s*$')
+_JSON_RE = re.compile(r'\{[^{}]*\}', re.DOTALL)
+_JSON_LIST_RE = re.compile(r'\[.*\]', re.DOTALL)
+
+
+# Keyword -> region patterns, checked in priority order. Each alternation is
+# compiled once at import so region detection is a single C-level scan per
+# region instead of dozens of Python-level `in` checks per locate.
+_REGION_KEYWORD_PATTERNS: List[Tuple[str, "re.Pattern"]] = [
+    # Top-right: status icons, system tray
+    ("top-right", re.compile("|".join(map(re.escape, (
+        "battery", "wifi", "bluetooth", "volume", "sound", "clock", "time",
+        "date", "status", "notification", "control center", "menu bar",
+    ))))),
+    # Top-left: app menus, close/minimize buttons (macOS)
+    ("top-left", re.compile("|".join(map(re.escape, (
+        "close", "minimize", "maximize", "apple menu", "file menu",
+        "edit menu", "app menu", "red button", "traffic light",
+    ))))),
+    # Left side: sidebars, navigation
+    ("left-half", re.compile("|".join(map(re.escape, (
+        "sidebar", "navigation", "nav", "menu", "hamburger", "drawer", "panel",
+    ))))),
+    # Top: toolbars, search bars
+    ("top-half", re.compile("|".join(map(re.escape, (
+        "toolbar", "search", "address bar", "url", "tab",
+    ))))),
+    # Bottom: docks, taskbars
+    ("bottom-half", re.compile("|".join(map(re.escape, (
+        "dock", "taskbar", "bottom",
+    ))))),
+]
+
+
+# google.generativeai pulls in gRPC and protobuf - hundreds of ms of
+# import time - so it's loaded on first model use, not at module import
+_genai_configured = False
+
+
+def _load_genai(api_key: Optional[str]):
+    """Import google.generativeai on first use and configure it once."""
+    global _genai_configured
+    import google.generativeai as genai
+
+    if api_key and not _genai_configured:
+        genai.configure(api_key=api_key)
+        _genai_configured = True
+    return genai
+
+
+# Normalized bounds per detectable region - scaled to pixels at the
+# single matching region instead of building the full dict every call
+_REGION_NORM_BOUNDS: Dict[str, Tuple[float, float, float, float]] = {
+    "top-right": (0.5, 0.0, 1.0, 0.5),
+    "top-left": (0.0, 0.0, 0.5, 0.5),
+    "bottom-right": (0.5, 0.5, 1.0, 1.0),
+    "bottom-left": (0.0, 0.5, 0.5, 1.0),
+    "top-half": (0.0, 0.0, 1.0, 0.5),
+    "bottom-half": (0.0, 0.5, 1.0, 1.0),
+    "left-half": (0.0, 0.0, 0.5, 1.0),
+    "right-half": (0.5, 0.0, 1.0, 1.0),
+}
+
+
+@functools.lru_cache(maxsize=4)
+def _cell_labels(cols: int, rows: int) -> Tuple[Tuple[str, ...], ...]:
+    """Precomputed cell label table, `_cell_labels(cols, rows)[row][col]` -> "B3"."""
+    return tuple(
+        tuple(f"{chr(ord('A') + col)}{row + 1}" for col in range(cols))
+        for row in range(rows)
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _build_grid_overlay(w: int, h: int, cols: int, rows: int) -> Image.Image:
+    """
+    Pre-render the static grid overlay (lines + cell labels) for a size.
+
+    Cached per (w, h, cols, rows) so repeated locates pay a single
+    alpha-composite instead of re-drawing lines, labels, and re-loading
+    the font every call.
+    """
+    cell_w = w / cols
+    cell_h = h / rows
+
+    # Paint all grid lines with two NumPy slice assignments instead of
+    # ~40 draw.line calls - the stores run at memcpy bandwidth
+    arr = np.zeros((h, w, 4), dtype=np.uint8)
+    xs = np.minimum((np.arange(cols + 1) * cell_w).astype(np.int32), w - 1)
+    ys = np.minimum((np.arange(rows + 1) * cell_h).astype(np.int32), h - 1)
+    arr[:, xs] = (255, 0, 0, 255)
+    arr[ys, :] = (255, 0, 0, 255)
+    overlay = Image.fromarray(arr, mode="RGBA")
+    draw = ImageDraw.Draw(overlay)
+
+    # Try to get a font - smaller for denser grids
+    from PIL import ImageFont
+    try:
+        font_size = max(8, min(int(cell_w / 4), int(cell_h / 4), 12))
+        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
+    except Exception:
+        font_size = 10
+        font = ImageFont.load_default()
+
+    # Draw cell labels (only every other cell to reduce clutter on dense
+    # grids). Labels come from a precomputed table and widths from a small
+    # per-length lookup - no chr/ord/f-string work inside the loop.
+    labels = _cell_labels(cols, rows)
+    label_w_by_len = [font_size * n * 0.6 for n in range(4)]
+    label_every = 2 if cols > 15 else 1
+    for row in range(0, rows, label_every):
+        for col in range(0, cols, label_every):
+            label = labels[row][col]
+
+            # Position label in top-left corner of cell
+            x = int(col * cell_w) + 1
+            y = int(row * cell_h) + 1
+
+            # Draw label with background for visibility
+            label_w = label_w_by_len[len(label)]
+            draw.rectangle([x, y, x + label_w + 2, y + font_size + 1], fill=(255, 255, 255, 220))
+            draw.text((x + 1, y), label, fill=(0, 0, 0, 255), font=font)
+
+    return overlay
+
+
+class _PreparedLocate(NamedTuple):
+    """Expensive per-locate preprocessing, reusable across retry attempts.
+
+    Holds the composed crop plus the coarse pass's already-encoded JPEG
+    payload; a retry only changes the prompt, so none of this needs to
+    be rebuilt.
+    """
+
+    img: Image.Image              # cropped search image
+    offset_x: int                 # crop origin in full-image coordinates
+    offset_y: int
+    detected_region: str
+    coarse_encoded: Tuple[Tuple[int, int], bytes]
+
+
 class IconLocator(BaseLocator):
     """
     Locator for icons using Gemini vision with a grid-based approach.
@@ -70,10 +232,13 @@ class IconLocator(BaseLocator):
     contains the target icon. This is more reliable and accurate.
     """
 
-    # Grid configuration - 24x16 gives tighter bounding boxes
-    # Each cell is about 45x50 pixels on a 1080p image
-    GRID_COLS = 24
-    GRID_ROWS = 16
+    # Grid configuration - 6x4 per pass, run coarse-to-fine.
+    # Two 6x4 passes inspect 48 cells total instead of the old single
+    # 24x16 grid's 384, and the labels stay large enough for the model
+    # to read reliably. Final precision is a 6x4 cell of a 6x4 cell,
+    # i.e. 36x16 effective resolution - tighter than the old grid.
+    GRID_COLS = 6
+    GRID_ROWS = 4
 
     def __init__(
         self,
@@ -85,9 +250,22 @@ class IconLocator(BaseLocator):
         self._fast_model = None  # For quick region detection
         self._smart_model = None  # For precise grid search
 
-        # Configure Gemini
-        if self.config.google_api_key:
-            genai.configure(api_key=self.config.google_api_key)
+        # LRU cache of parsed Gemini verdicts keyed by (image digest, prompt).
+        # Retries and plan refinements often re-ask about the identical
+        # screenshot - a hit returns in microseconds instead of ~1s
+        self._response_cache: "OrderedDict[Tuple[bytes, str], dict]" = OrderedDict()
+        self._response_cache_size = 128
+
+        # Reusable JPEG encode buffer (thread-local - locates may fan out
+        # over worker threads) so each call doesn't alloc/free a fresh
+        # BytesIO and its backing storage
+        self._local = threading.local()
+
+        # Gemini import and configuration are deferred to first model use
+        # (see _load_genai); warmup pays both costs up front instead
+        if self.config.google_api_key and self.config.warmup:
+            _ = self.fast_model
+            _ = self.smart_model
 
     @property
     def name(self) -> str:
@@ -97,6 +275,7 @@ class IconLocator(BaseLocator):
     def fast_model(self):
         """Fast model for region detection (pass 1)."""
         if self._fast_model is None:
+            genai = _load_genai(self.config.google_api_key)
             self._fast_model = genai.GenerativeModel(self.config.gemini_fast_model)
         return self._fast_model
 
@@ -104,6 +283,7 @@ class IconLocator(BaseLocator):
     def smart_model(self):
         """Fast model for grid search - denser grid + cropped region = good accuracy."""
         if self._smart_model is None:
+            genai = _load_genai(self.config.google_api_key)
             # Use fast model since we're cropping to smaller region with denser grid
             self._smart_model = genai.GenerativeModel(self.config.gemini_fast_model)
         return self._smart_model
@@ -115,64 +295,27 @@ class IconLocator(BaseLocator):
         """
         Draw a labeled grid overlay on the image.
 
+        The grid template (lines + labels) only depends on the image size,
+        so it's pre-rendered once per (width, height) and alpha-composited
+        onto each screenshot - one blend instead of hundreds of draw calls.
+
         Returns a new image with grid lines and cell labels (A1, B2, etc.)
         """
-        # Create a copy to draw on
-        grid_img = img.copy()
-        draw = ImageDraw.Draw(grid_img)
-
-        w, h = img.size
-        cell_w = w / self.GRID_COLS
-        cell_h = h / self.GRID_ROWS
-
-        # Grid line color - semi-transparent red
-        line_color = (255, 0, 0, 180)
-
-        # Draw vertical lines
-        for col in range(self.GRID_COLS + 1):
-            x = int(col * cell_w)
-            draw.line([(x, 0), (x, h)], fill=line_color, width=1)
-
-        # Draw horizontal lines
-        for row in range(self.GRID_ROWS + 1):
-            y = int(row * cell_h)
-            draw.line([(0, y), (w, y)], fill=line_color, width=1)
+        overlay = _build_grid_overlay(
+            img.width, img.height, self.GRID_COLS, self.GRID_ROWS
+        )
+        return Image.alpha_composite(img.convert("RGBA"), overlay).convert("RGB")
 
-        # Try to get a font - smaller for denser grids
-        try:
-            font_size = max(8, min(int(cell_w / 4), int(cell_h / 4), 12))
-            font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", font_size)
-        except Exception:
-            font = ImageFont.load_default()
-
-        # Draw cell labels (only every other cell to reduce clutter on dense grids)
-        label_every = 2 if self.GRID_COLS > 15 else 1
-        for row in range(self.GRID_ROWS):
-            for col in range(self.GRID_COLS):
-                # Column letter (A-T for 20 cols)
-                col_letter = chr(ord('A') + col)
-                row_num = row + 1
-                label = f"{col_letter}{row_num}"
-
-                # Position label in top-left corner of cell
-                x = int(col * cell_w) + 1
-                y = int(row * cell_h) + 1
-
-                # Only draw labels at intervals to reduce clutter
-                if row % label_every == 0 and col % label_every == 0:
-                    # Draw label with background for visibility
-                    label_w = font_size * len(label) * 0.6
-                    draw.rectangle([x, y, x + label_w + 2, y + font_size + 1], fill=(255, 255, 255, 220))
-                    draw.text((x + 1, y), label, fill=(0, 0, 0), font=font)
-
-        return grid_img
-
-    def _cell_to_bbox(self, cell: str, img_width: int, img_height: int) -> BoundingBox:
+    def _cell_to_bbox(
+        self, cell: str, img_width: int, img_height: int, padding: float = 0.15
+    ) -> BoundingBox:
         """
         Convert a grid cell label (e.g., "B3") to a bounding box.
 
         Returns the bounding box for the center region of the cell
-        (slightly smaller than full cell to be more precise).
+        (slightly smaller than full cell to be more precise). Pass
+        padding=0 to get the full cell (used for the coarse pass, where
+        the cell is re-searched rather than clicked).
         """
         # Parse cell label
         col_letter = cell[0].upper()
@@ -182,12 +325,17 @@ class IconLocator(BaseLocator):
         col = ord(col_letter) - ord('A')
         row = row_num - 1
 
+        # A model echoing an off-grid cell must land in the existing
+        # invalid-cell handling, not get clamped to the image edge and
+        # reported as found
+        if not (0 <= col < self.GRID_COLS and 0 <= row < self.GRID_ROWS):
+            raise ValueError(f"Cell {cell!r} outside {self.GRID_COLS}x{self.GRID_ROWS} grid")
+
         # Calculate cell dimensions
         cell_w = img_width / self.GRID_COLS
         cell_h = img_height / self.GRID_ROWS
 
         # Get cell bounds (with small padding inward for precision)
-        padding = 0.15  # Use center 70% of cell
         x1 = int((col + padding) * cell_w)
         y1 = int((row + padding) * cell_h)
         x2 = int((col + 1 - padding) * cell_w)
@@ -202,41 +350,23 @@ class IconLocator(BaseLocator):
         Returns:
             Tuple of (region_name, (x1, y1, x2, y2) crop bounds in pixels)
         """
-        text = f"{instruction} {target}".lower()
         w, h = img_width, img_height
 
-        # Region bounds
-        regions = {
-            "top-right": (w // 2, 0, w, h // 2),
-            "top-left": (0, 0, w // 2, h // 2),
-            "bottom-right": (w // 2, h // 2, w, h),
-            "bottom-left": (0, h // 2, w // 2, h),
-            "top-half": (0, 0, w, h // 2),
-            "bottom-half": (0, h // 2, w, h),
-            "left-half": (0, 0, w // 2, h),
-            "right-half": (w // 2, 0, w, h),
-        }
-
-        # Keyword -> region mapping
-        # Top-right: status icons, system tray
-        if any(kw in text for kw in ["battery", "wifi", "bluetooth", "volume", "sound", "clock", "time", "date", "status", "notification", "control center", "menu bar"]):
-            return ("top-right", regions["top-right"])
+        # Nothing to scan - skip the lowercase/join and pattern passes
+        if not instruction.strip() and not target.strip():
+            return ("full", (0, 0, w, h))
 
-        # Top-left: app menus, close/minimize buttons (macOS)
-        if any(kw in text for kw in ["close", "minimize", "maximize", "apple menu", "file menu", "edit menu", "app menu", "red button", "traffic light"]):
-            return ("top-left", regions["top-left"])
-
-        # Left side: sidebars, navigation
-        if any(kw in text for kw in ["sidebar", "navigation", "nav", "menu", "hamburger", "drawer", "panel"]):
-            return ("left-half", regions["left-half"])
-
-        # Top: toolbars, search bars
-        if any(kw in text for kw in ["toolbar", "search", "address bar", "url", "tab"]):
-            return ("top-half", regions["top-half"])
+        text = f"{instruction} {target}".lower()
 
-        # Bottom: docks, taskbars
-        if any(kw in text for kw in ["dock", "taskbar", "bottom"]):
-            return ("bottom-half", regions["bottom-half"])
+        # Single compiled-regex scan per region, in priority order.
+        # Bounds are computed only for the region that matches.
+        for region_name, pattern in _REGION_KEYWORD_PATTERNS:
+            if pattern.search(text):
+                nx1, ny1, nx2, ny2 = _REGION_NORM_BOUNDS[region_name]
+                return (
+                    region_name,
+                    (int(nx1 * w), int(ny1 * h), int(nx2 * w), int(ny2 * h)),
+                )
 
         # Default to full if no keywords match
         return ("full", (0, 0, w, h))
@@ -245,21 +375,15 @@ class IconLocator(BaseLocator):
         """Parse JSON response from Gemini."""
         text = text.strip()
 
-        # Strip markdown code blocks if present
+        # Strip markdown code block fences if present
         if text.startswith("```"):
-            lines = text.split("\n")
-            if lines[0].startswith("```"):
-                lines = lines[1:]
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines)
+            text = _CODEBLOCK_RE.sub("", text)
 
         try:
             return json.loads(text)
         except json.JSONDecodeError:
             # Try to extract JSON from the response
-            import re
-            json_match = re.search(r'\{[^{}]*\}', text, re.DOTALL)
+            json_match = _JSON_RE.search(text)
             if json_match:
                 try:
                     return json.loads(json_match.group())
@@ -284,88 +408,251 @@ class IconLocator(BaseLocator):
         }
         return quads.get(quad, (0, 0, w, h))
 
-    def locate(
+    def _encode_jpeg(self, img: Image.Image) -> bytes:
+        """
+        JPEG-encode an image for upload, reusing a per-thread buffer.
+
+        We serialize to a bounded-size JPEG ourselves - the SDK would
+        otherwise re-encode the PIL image as near-lossless PNG, inflating
+        the upload.
+        """
+        buf = getattr(self._local, "jpeg_buf", None)
+        if buf is None:
+            buf = self._local.jpeg_buf = io.BytesIO()
+        buf.seek(0)
+        buf.truncate()
+        img.convert("RGB").save(buf, format="JPEG", quality=80, subsampling=2)
+        return buf.getvalue()
+
+    def _encode_grid(
+        self, img: Image.Image, max_width: int
+    ) -> Tuple[Tuple[int, int], bytes]:
+        """Resize, overlay the grid, and JPEG-encode one pass's payload.
+
+        Returns:
+            Tuple of ((api_width, api_height), jpeg_bytes)
+        """
+        img_for_api = resize_for_api(img, max_width=max_width)
+        grid_img = self._draw_grid_overlay(img_for_api)
+        return (img_for_api.width, img_for_api.height), self._encode_jpeg(grid_img)
+
+    def _grid_search(
+        self,
+        img: Image.Image,
+        target: str,
+        instruction: str,
+        max_width: int = 800,
+        padding: float = 0.15,
+        encoded: Optional[Tuple[Tuple[int, int], bytes]] = None,
+    ) -> Tuple[Optional[BoundingBox], dict]:
+        """
+        Run one grid-overlay pass: resize, draw grid, ask Gemini for the cell.
+
+        Pass `encoded` (from _encode_grid) to reuse an already-built
+        payload - retries only change the prompt.
+
+        Returns:
+            Tuple of (bbox in `img` coordinates or None, parsed response dict)
+        """
+        if encoded is None:
+            encoded = self._encode_grid(img, max_width)
+        (api_w, api_h), payload = encoded
+
+        # Calculate scale factors
+        scale_x = img.width / api_w
+        scale_y = img.height / api_h
+
+        # Build prompt
+        max_col_letter = chr(ord('A') + self.GRID_COLS - 1)
+        prompt = ICON_GRID_PROMPT.format(
+            rows=self.GRID_ROWS,
+            cols=self.GRID_COLS,
+            max_col=max_col_letter,
+            target=target,
+            instruction=instruction,
+        )
+
+        image_part = {"mime_type": "image/jpeg", "data": payload}
+
+        # Cache at the API boundary: identical payload + prompt means an
+        # identical verdict. The cheap cell->pixel math below is recomputed,
+        # so offsets stay correct regardless of where the crop came from.
+        cache_key = (
+            hashlib.blake2b(image_part["data"], digest_size=16).digest(),
+            prompt,
+        )
+        result = self._response_cache.get(cache_key)
+        if result is not None:
+            self._response_cache.move_to_end(cache_key)
+        else:
+            response = self.smart_model.generate_content([prompt, image_part])
+            result = self._parse_response(response.text)
+
+            self._response_cache[cache_key] = result
+            if len(self._response_cache) > self._response_cache_size:
+                self._response_cache.popitem(last=False)
+
+        if not (result.get("found") and result.get("cell")):
+            return None, result
+
+        # Convert cell to bounding box and scale back to `img` coordinates
+        bbox_api = self._cell_to_bbox(
+            result["cell"], api_w, api_h, padding=padding
+        )
+        return (
+            BoundingBox(
+                int(bbox_api.x1 * scale_x),
+                int(bbox_api.y1 * scale_y),
+                int(bbox_api.x2 * scale_x),
+                int(bbox_api.y2 * scale_y),
+            ),
+            result,
+        )
+
+    def _prepare(
         self,
         img: Image.Image,
         target: str,
         region: str = "full",
         instruction: str = "",
         quad: Optional[int] = None,
-        **kwargs,
-    ) -> LocatorResult:
+    ) -> _PreparedLocate:
         """
-        Find an icon on screen using Gemini vision with grid-based localization.
-
-        Args:
-            img: Screenshot as PIL Image
-            target: Description of the icon to find
-            region: Screen region to search in (from step config)
-            instruction: Full instruction context
-            quad: Quadrant to search (1=top-left, 2=top-right, 3=bottom-left, 4=bottom-right)
+        Run the expensive preprocessing for one locate call.
 
-        Returns:
-            LocatorResult with found status and coordinates
+        Composes the region + quad crops, crops the original buffer once,
+        and pre-encodes the coarse pass's grid payload. `locate_with_retry`
+        prepares once and reuses the result - a retry only changes the
+        prompt, not the pixels.
         """
-        start = time.time()
         original_img = img
-        offset_x, offset_y = 0, 0
+
+        # Compose all crop bounds first, then crop the original buffer once.
+        # Region crop + quad crop as separate img.crop calls would copy a
+        # multi-megabyte intermediate on every retina screenshot.
+        bx1, by1 = 0, 0
+        bx2, by2 = img.width, img.height
 
         # First, apply any region from step config
         if region != "full":
             try:
-                cropped, (offset_x, offset_y) = self.regions.crop_image(img, region)
-                img = cropped
+                bx1, by1, bx2, by2 = self.regions.get(region).to_pixels(
+                    img.width, img.height
+                )
             except Exception:
                 pass
 
+        region_w = bx2 - bx1
+        region_h = by2 - by1
+
         # Use quad if provided (from planner), otherwise try keyword detection
         detected_region = "full"
         valid_quads = [1, 2, 3, 4, "top", "bottom", "left", "right"]
         if quad in valid_quads:
             # Use quad from planner
-            bounds = self._get_quad_bounds(quad, img.width, img.height)
+            qx1, qy1, qx2, qy2 = self._get_quad_bounds(quad, region_w, region_h)
             detected_region = f"quad-{quad}" if isinstance(quad, int) else quad
-            x1, y1, x2, y2 = bounds
-            img = img.crop((x1, y1, x2, y2))
-            offset_x += x1
-            offset_y += y1
         else:
             # Fallback: detect from instruction keywords
-            instruction_context = instruction if instruction else f"Find the {target}"
-            detected_region, bounds = self._detect_region_from_instruction(
-                instruction_context, target, img.width, img.height
+            detected_region, (qx1, qy1, qx2, qy2) = self._detect_region_from_instruction(
+                instruction, target, region_w, region_h
             )
-            if detected_region != "full":
-                x1, y1, x2, y2 = bounds
-                img = img.crop((x1, y1, x2, y2))
-                offset_x += x1
-                offset_y += y1
 
-        # Resize cropped region for grid search - can use smaller size since region is focused
-        img_for_api = resize_for_api(img, max_width=800)
+        # Quad bounds are relative to the region - translate to the original
+        bx2 = bx1 + qx2
+        by2 = by1 + qy2
+        bx1 += qx1
+        by1 += qy1
+
+        if (bx1, by1, bx2, by2) != (0, 0, original_img.width, original_img.height):
+            img = original_img.crop((bx1, by1, bx2, by2))
+
+        # Coarse pass runs at 400px - encode its payload now so retries
+        # skip the resize/overlay/JPEG work entirely
+        return _PreparedLocate(
+            img=img,
+            offset_x=bx1,
+            offset_y=by1,
+            detected_region=detected_region,
+            coarse_encoded=self._encode_grid(img, max_width=400),
+        )
 
-        # Calculate scale factors
-        scale_x = img.width / img_for_api.width
-        scale_y = img.height / img_for_api.height
+    def locate(
+        self,
+        img: Image.Image,
+        target: str,
+        region: str = "full",
+        instruction: str = "",
+        quad: Optional[int] = None,
+        _prep: Optional[_PreparedLocate] = None,
+        **kwargs,
+    ) -> LocatorResult:
+        """
+        Find an icon on screen using Gemini vision with grid-based localization.
 
-        # Draw grid overlay
-        grid_img = self._draw_grid_overlay(img_for_api)
+        Args:
+            img: Screenshot as PIL Image
+            target: Description of the icon to find
+            region: Screen region to search in (from step config)
+            instruction: Full instruction context
+            quad: Quadrant to search (1=top-left, 2=top-right, 3=bottom-left, 4=bottom-right)
+            _prep: Preprocessed crop/payload from `_prepare` - passed by
+                `locate_with_retry` so retries reuse it
 
-        # Build prompt
-        max_col_letter = chr(ord('A') + self.GRID_COLS - 1)
+        Returns:
+            LocatorResult with found status and coordinates
+        """
+        start = time.time()
+        original_img = img
         instruction_context = instruction if instruction else f"Find the {target}"
-        prompt = ICON_GRID_PROMPT.format(
-            rows=self.GRID_ROWS,
-            cols=self.GRID_COLS,
-            max_col=max_col_letter,
-            target=target,
-            instruction=instruction_context,
-        )
+
+        if _prep is None:
+            _prep = self._prepare(img, target, region, instruction_context, quad)
+        img = _prep.img
+        offset_x, offset_y = _prep.offset_x, _prep.offset_y
+        detected_region = _prep.detected_region
 
         try:
-            # Use smart model for precise grid search
-            response = self.smart_model.generate_content([prompt, grid_img])
-            result = self._parse_response(response.text)
+            # Coarse pass: which 6x4 cell of the (possibly cropped) region
+            # holds the icon? Full cell bounds - it gets re-searched, not
+            # clicked. 400px is plenty for a 6x4 localization and sends
+            # roughly a quarter of the vision tokens of the fine pass.
+            coarse_bbox, coarse_result = self._grid_search(
+                img, target, instruction_context, max_width=400, padding=0.0,
+                encoded=_prep.coarse_encoded,
+            )
+
+            if coarse_bbox is None:
+                elapsed_ms = (time.time() - start) * 1000
+                return LocatorResult(
+                    found=False,
+                    element=None,
+                    bbox=None,
+                    confidence=0,
+                    method=LocatorMethod.ICON,
+                    time_ms=elapsed_ms,
+                    suggestions=[coarse_result.get("description", "Icon not found")],
+                )
+
+            # Fine pass: crop to the coarse cell with 10% margin (icons can
+            # straddle a cell edge) and re-grid the crop
+            margin = int(0.10 * max(img.width / self.GRID_COLS, img.height / self.GRID_ROWS))
+            fine_box = coarse_bbox.expand(margin).clamp(img.width, img.height)
+            fine_img = img.crop((fine_box.x1, fine_box.y1, fine_box.x2, fine_box.y2))
+
+            fine_bbox, fine_result = self._grid_search(
+                img=fine_img,
+                target=target,
+                instruction=instruction_context,
+            )
+        except (ValueError, IndexError) as e:
+            elapsed_ms = (time.time() - start) * 1000
+            return LocatorResult(
+                found=False,
+                method=LocatorMethod.ICON,
+                time_ms=elapsed_ms,
+                suggestions=[f"Invalid cell returned by Gemini: {e}"],
+            )
         except Exception as e:
             elapsed_ms = (time.time() - start) * 1000
             return LocatorResult(
@@ -377,61 +664,158 @@ class IconLocator(BaseLocator):
 
         elapsed_ms = (time.time() - start) * 1000
 
-        if result.get("found") and result.get("cell"):
-            cell = result["cell"]
+        if fine_bbox is not None:
+            # Compose: fine bbox -> coarse crop -> region crop -> full image
+            x1 = fine_bbox.x1 + fine_box.x1 + offset_x
+            y1 = fine_bbox.y1 + fine_box.y1 + offset_y
+            x2 = fine_bbox.x2 + fine_box.x1 + offset_x
+            y2 = fine_bbox.y2 + fine_box.y1 + offset_y
+            cell = f"{coarse_result['cell']}/{fine_result['cell']}"
+            description = fine_result.get("description", f"Found in cell {cell}")
+        else:
+            # Fine pass lost it - fall back to the coarse cell (still a
+            # usable click target, just a larger box)
+            x1 = coarse_bbox.x1 + offset_x
+            y1 = coarse_bbox.y1 + offset_y
+            x2 = coarse_bbox.x2 + offset_x
+            y2 = coarse_bbox.y2 + offset_y
+            cell = coarse_result["cell"]
+            description = coarse_result.get("description", f"Found in cell {cell}")
+
+        # Clamp to image bounds
+        x1 = max(0, min(x1, original_img.width - 1))
+        y1 = max(0, min(y1, original_img.height - 1))
+        x2 = max(0, min(x2, original_img.width))
+        y2 = max(0, min(y2, original_img.height))
+
+        region_info = f" in {detected_region}" if detected_region != "full" else ""
 
-            try:
-                # Convert cell to bounding box (in API image coordinates)
-                bbox_api = self._cell_to_bbox(cell, img_for_api.width, img_for_api.height)
-
-                # Scale coordinates back to cropped image size
-                x1 = int(bbox_api.x1 * scale_x)
-                y1 = int(bbox_api.y1 * scale_y)
-                x2 = int(bbox_api.x2 * scale_x)
-                y2 = int(bbox_api.y2 * scale_y)
-
-                # Add all offsets to get coordinates in original full image
-                x1 += offset_x
-                y1 += offset_y
-                x2 += offset_x
-                y2 += offset_y
-
-                # Clamp to image bounds
-                x1 = max(0, min(x1, original_img.width - 1))
-                y1 = max(0, min(y1, original_img.height - 1))
-                x2 = max(0, min(x2, original_img.width))
-                y2 = max(0, min(y2, original_img.height))
-
-                description = result.get("description", f"Found in cell {cell}")
-                region_info = f" in {detected_region}" if detected_region != "full" else ""
+        return LocatorResult(
+            found=True,
+            element=f"{target} ({description}{region_info})",
+            bbox=BoundingBox(x1, y1, x2, y2),
+            confidence=90 if fine_bbox is not None else 75,
+            method=LocatorMethod.ICON,
+            time_ms=elapsed_ms,
+        )
 
-                return LocatorResult(
-                    found=True,
-                    element=f"{target} ({description}{region_info})",
-                    bbox=BoundingBox(x1, y1, x2, y2),
-                    confidence=90,
-                    method=LocatorMethod.ICON,
-                    time_ms=elapsed_ms,
-                )
-            except (ValueError, IndexError):
-                return LocatorResult(
+    def _parse_list_response(self, text: str, expected: int) -> List[dict]:
+        """Parse a JSON-array response from Gemini, padded/truncated to `expected`."""
+        text = text.strip()
+        if text.startswith("```"):
+            text = _CODEBLOCK_RE.sub("", text)
+
+        parsed: Any = None
+        try:
+            parsed = json.loads(text)
+        except json.JSONDecodeError:
+            list_match = _JSON_LIST_RE.search(text)
+            if list_match:
+                try:
+                    parsed = json.loads(list_match.group())
+                except json.JSONDecodeError:
+                    pass
+
+        if not isinstance(parsed, list):
+            parsed = []
+
+        miss = {"found": False, "cell": None, "description": "Failed to parse response"}
+        results = [r if isinstance(r, dict) else miss for r in parsed[:expected]]
+        results.extend([miss] * (expected - len(results)))
+        return results
+
+    def locate_many(
+        self,
+        img: Image.Image,
+        targets: List[str],
+        instruction: str = "",
+        **kwargs,
+    ) -> List[LocatorResult]:
+        """
+        Find several icons with a single Gemini call.
+
+        One grid overlay, one image upload, one prompt listing every
+        target - N round-trips and N prefills collapse into one. Results
+        come back in the same order as targets.
+        """
+        start = time.time()
+
+        if not targets:
+            return []
+
+        img_for_api = resize_for_api(img, max_width=800)
+        scale_x = img.width / img_for_api.width
+        scale_y = img.height / img_for_api.height
+
+        grid_img = self._draw_grid_overlay(img_for_api)
+
+        targets_block = "\n".join(f"{i + 1}) {t}" for i, t in enumerate(targets))
+        max_col_letter = chr(ord('A') + self.GRID_COLS - 1)
+        prompt = ICON_GRID_MANY_PROMPT.format(
+            rows=self.GRID_ROWS,
+            cols=self.GRID_COLS,
+            max_col=max_col_letter,
+            targets_block=targets_block,
+        )
+        if instruction:
+            prompt = f"{prompt}\n\nCONTEXT: {instruction}"
+
+        image_part = {"mime_type": "image/jpeg", "data": self._encode_jpeg(grid_img)}
+
+        try:
+            response = self.smart_model.generate_content([prompt, image_part])
+            parsed = self._parse_list_response(response.text, expected=len(targets))
+        except Exception as e:
+            elapsed_ms = (time.time() - start) * 1000
+            return [
+                LocatorResult(
                     found=False,
                     method=LocatorMethod.ICON,
                     time_ms=elapsed_ms,
-                    suggestions=[f"Invalid cell '{cell}' returned by Gemini"],
+                    suggestions=[f"Gemini API error: {str(e)}"],
                 )
+                for _ in targets
+            ]
 
-        # Not found
-        description = result.get("description", "Icon not found")
-        return LocatorResult(
-            found=False,
-            element=None,
-            bbox=None,
-            confidence=0,
-            method=LocatorMethod.ICON,
-            time_ms=elapsed_ms,
-            suggestions=[description],
-        )
+        elapsed_ms = (time.time() - start) * 1000
+
+        results = []
+        for target, entry in zip(targets, parsed):
+            if entry.get("found") and entry.get("cell"):
+                try:
+                    bbox_api = self._cell_to_bbox(
+                        entry["cell"], img_for_api.width, img_for_api.height
+                    )
+                    bbox = BoundingBox(
+                        max(0, min(int(bbox_api.x1 * scale_x), img.width - 1)),
+                        max(0, min(int(bbox_api.y1 * scale_y), img.height - 1)),
+                        max(0, min(int(bbox_api.x2 * scale_x), img.width)),
+                        max(0, min(int(bbox_api.y2 * scale_y), img.height)),
+                    )
+                    description = entry.get("description", f"Found in cell {entry['cell']}")
+                    results.append(LocatorResult(
+                        found=True,
+                        element=f"{target} ({description})",
+                        bbox=bbox,
+                        confidence=90,
+                        method=LocatorMethod.ICON,
+                        time_ms=elapsed_ms,
+                    ))
+                    continue
+                except (ValueError, IndexError):
+                    entry = {"description": f"Invalid cell '{entry['cell']}' returned by Gemini"}
+
+            results.append(LocatorResult(
+                found=False,
+                element=None,
+                bbox=None,
+                confidence=0,
+                method=LocatorMethod.ICON,
+                time_ms=elapsed_ms,
+                suggestions=[entry.get("description", "Icon not found")],
+            ))
+
+        return results
 
     def locate_with_retry(
         self,
@@ -446,8 +830,14 @@ class IconLocator(BaseLocator):
         Find an icon with retry logic for improved accuracy.
 
         Makes multiple attempts with slightly different prompts if needed.
+        The crop composition, resize, grid overlay, and JPEG encode are
+        prepared once and shared - a retry only changes the prompt.
         """
-        result = self.locate(img, target, region, instruction, **kwargs)
+        instruction_context = instruction if instruction else f"Find the {target}"
+        prep = self._prepare(
+            img, target, region, instruction_context, kwargs.get("quad")
+        )
+        result = self.locate(img, target, region, instruction, _prep=prep, **kwargs)
 
         if result.found:
             return result
@@ -456,6 +846,8 @@ class IconLocator(BaseLocator):
         if max_attempts > 1:
             # Second attempt with emphasis on visual patterns
             enhanced_instruction = f"{instruction}. Look for visual patterns like dots, lines, shapes that form the icon."
-            result = self.locate(img, target, region, enhanced_instruction, **kwargs)
+            result = self.locate(
+                img, target, region, enhanced_instruction, _prep=prep, **kwargs
+            )
 
         return result
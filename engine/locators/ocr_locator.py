@@ -2,11 +2,26 @@
 OCR-based text locator using Tesseract.
 """
 
+import functools
+import os
+import re
+import threading
 import time
-from difflib import SequenceMatcher
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Dict, Any, Tuple
+import numpy as np
 from PIL import Image
 import pytesseract
+from rapidfuzz import fuzz, process, utils as fuzz_utils
+
+try:
+    # Optional accelerator: in-process Tesseract via its C API. Avoids the
+    # subprocess fork + model reload + temp-file round trip that pytesseract
+    # pays on every call. Falls back to pytesseract when not installed.
+    from tesserocr import PyTessBaseAPI, RIL, iterate_level
+    _HAS_TESSEROCR = True
+except ImportError:
+    _HAS_TESSEROCR = False
 
 from engine.core.types import BoundingBox, LocatorResult, LocatorMethod
 from engine.core.regions import RegionManager, get_region_manager
@@ -16,6 +31,20 @@ from engine.locators.base import BaseLocator
 from engine.config import Config, get_config
 
 
+# Tokens too generic to discriminate a target on their own - built once as
+# a frozenset so membership checks don't rebuild a set literal per call
+STOP_WORDS = frozenset({
+    "the", "a", "an", "to", "of", "in", "on", "for", "and", "or", "with",
+    "button", "icon", "menu", "item", "option", "link", "text", "label",
+})
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_ratio(target: str, text: str) -> float:
+    """Normalized fuzz.ratio, memoized for repeated (target, text) pairs."""
+    return fuzz.ratio(target, text, processor=fuzz_utils.default_process) / 100.0
+
+
 class OCRLocator(BaseLocator):
     """
     Locator using Tesseract OCR for text detection.
@@ -33,9 +62,31 @@ class OCRLocator(BaseLocator):
         region_manager: Optional[RegionManager] = None,
     ):
         self.config = config or get_config()
-        self.cache = cache or get_ocr_cache(self.config.ocr_cache_size)
+        self.cache = cache or get_ocr_cache(
+            self.config.ocr_cache_size, self.config.ocr_cache_policy
+        )
         self.regions = region_manager or get_region_manager()
 
+        # Preprocessed (grayscale + threshold) views keyed by id(img) so
+        # repeated OCR on the same image object skips preprocessing.
+        # Entries pin the source image - single locate() calls (the API
+        # route) never clear this between screenshots, so without a
+        # strong reference a recycled id could serve a stale frame
+        self._preproc_cache: Dict[int, Tuple[Image.Image, Image.Image, float]] = {}
+
+        # Persistent tesserocr handles (lazy, one per thread - the API
+        # object isn't thread-safe but the loaded model is reused across
+        # calls instead of re-initialized per OCR)
+        self._tess_local = threading.local()
+
+        # Lazy worker pool for OCRing several regions of one screenshot
+        # concurrently (see locate_many)
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def clear_preprocess_cache(self) -> None:
+        """Clear cached preprocessed images (call between screenshot batches)."""
+        self._preproc_cache.clear()
+
     @property
     def name(self) -> str:
         return "ocr"
@@ -44,82 +95,254 @@ class OCRLocator(BaseLocator):
         # OCR only works for text, not icons
         return not is_icon
 
-    def _run_ocr(self, img: Image.Image) -> Dict[str, Any]:
-        """Run Tesseract OCR, using cache if available."""
-        # Check cache first
-        cached = self.cache.get(img)
-        if cached:
-            return cached.ocr_data
+    @staticmethod
+    def _otsu_threshold(histogram: List[int]) -> int:
+        """Compute Otsu's threshold from a 256-bin grayscale histogram."""
+        total = sum(histogram)
+        if total == 0:
+            return 127
+
+        sum_total = sum(i * count for i, count in enumerate(histogram))
+        sum_bg = 0.0
+        weight_bg = 0
+        max_variance = 0.0
+        threshold = 127
+
+        for i in range(256):
+            weight_bg += histogram[i]
+            if weight_bg == 0:
+                continue
+            weight_fg = total - weight_bg
+            if weight_fg == 0:
+                break
+
+            sum_bg += i * histogram[i]
+            mean_bg = sum_bg / weight_bg
+            mean_fg = (sum_total - sum_bg) / weight_fg
+
+            variance = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+            if variance > max_variance:
+                max_variance = variance
+                threshold = i
+
+        return threshold
+
+    def _preprocess(self, img: Image.Image) -> Tuple[Image.Image, float]:
+        """
+        Prepare an image for Tesseract: grayscale, downscale, Otsu binarize.
+
+        Cached by id(img) so repeated calls on the same image object
+        (e.g. the not-found suggestion path) skip the work; hits require
+        the stored source to be the same object, so an id recycled after
+        gc can't alias a dead screenshot's preprocessed frame.
+
+        Returns:
+            Tuple of (preprocessed image, coordinate scale factor)
+        """
+        cached = self._preproc_cache.get(id(img))
+        if cached is not None and cached[0] is img:
+            return cached[1], cached[2]
+
+        # Grayscale first - 1/3 the bytes for the resize below
+        gray = img.convert("L")
 
         # Resize large images for faster OCR (scale coordinates back later)
-        # Max 1800px width - good balance of speed and accuracy
+        # Max 1800px width - good balance of speed and accuracy.
+        # BOX (area averaging) on the single grayscale channel stays in
+        # uint8 with a fixed 1-tap-per-source-pixel kernel - several times
+        # cheaper than LANCZOS, and Tesseract doesn't benefit from the
+        # sharper (ring-prone) filter anyway
         max_width = 1800
         scale = 1.0
-        if img.width > max_width:
-            scale = img.width / max_width
-            new_height = int(img.height / scale)
-            img_for_ocr = img.resize((max_width, new_height), Image.LANCZOS)
-        else:
-            img_for_ocr = img
+        if gray.width > max_width:
+            scale = gray.width / max_width
+            new_height = int(gray.height / scale)
+            gray = gray.resize((max_width, new_height), Image.BOX)
+
+        # Otsu binarization - improves both OCR speed and accuracy
+        threshold = self._otsu_threshold(gray.histogram())
+        img_for_ocr = gray.point(lambda p: 255 if p > threshold else 0)
+
+        # Keep the cache tiny - it only needs to cover one screenshot batch
+        if len(self._preproc_cache) >= 8:
+            self._preproc_cache.clear()
+        self._preproc_cache[id(img)] = (img, img_for_ocr, scale)
+        return img_for_ocr, scale
+
+    def _ocr_data(self, img_for_ocr: Image.Image) -> Dict[str, Any]:
+        """
+        Produce pytesseract-shaped word data for a preprocessed image.
+
+        Uses a persistent tesserocr PyTessBaseAPI when available - one
+        in-process Recognize call against an already-loaded model instead
+        of pytesseract's per-call subprocess fork, temp-file write, and
+        model reload. Falls back to pytesseract otherwise.
+        """
+        if not _HAS_TESSEROCR:
+            return pytesseract.image_to_data(img_for_ocr, output_type=pytesseract.Output.DICT)
+
+        api = getattr(self._tess_local, "api", None)
+        if api is None:
+            api = self._tess_local.api = PyTessBaseAPI()
+        api.SetImage(img_for_ocr)
+        api.Recognize()
+
+        data: Dict[str, Any] = {
+            "text": [], "left": [], "top": [], "width": [], "height": [],
+            "conf": [], "block_num": [], "line_num": [],
+        }
+        ri = api.GetIterator()
+        if ri is None:
+            return data
+
+        block_num = 0
+        line_num = 0
+        for word in iterate_level(ri, RIL.WORD):
+            if word.IsAtBeginningOf(RIL.BLOCK):
+                block_num += 1
+                line_num = 0
+            if word.IsAtBeginningOf(RIL.TEXTLINE):
+                line_num += 1
+
+            text = word.GetUTF8Text(RIL.WORD)
+            if text is None:
+                continue
+            x1, y1, x2, y2 = word.BoundingBox(RIL.WORD)
+
+            data["text"].append(text.strip())
+            data["left"].append(x1)
+            data["top"].append(y1)
+            data["width"].append(x2 - x1)
+            data["height"].append(y2 - y1)
+            data["conf"].append(int(word.Confidence(RIL.WORD)))
+            data["block_num"].append(block_num)
+            data["line_num"].append(line_num)
+
+        return data
+
+    def _run_ocr(
+        self, img: Image.Image
+    ) -> Tuple[Dict[str, Any], List[str], List[str]]:
+        """
+        Run Tesseract OCR, using cache if available.
+
+        Returns:
+            Tuple of (OCR data dict, non-empty text list, pre-lowered text
+            column). The derived lists are cached alongside the data so
+            repeated locates on the same screenshot rebuild neither.
+        """
+        # Check cache first - the key is computed once and reused for the
+        # put below, so a locate never hashes the same crop twice
+        key = self.cache.compute_key(img)
+        cached = self.cache.get(img, img_hash=key)
+        if cached:
+            if cached.text_lower is None:
+                cached.text_lower = [
+                    t.lower() if t.strip() else "" for t in cached.ocr_data["text"]
+                ]
+            return cached.ocr_data, cached.all_text, cached.text_lower
+
+        img_for_ocr, scale = self._preprocess(img)
 
         # Run OCR
         try:
-            data = pytesseract.image_to_data(img_for_ocr, output_type=pytesseract.Output.DICT)
+            data = self._ocr_data(img_for_ocr)
         except Exception as e:
             raise OCRError(f"Tesseract failed: {e}", cause=e)
 
-        # Scale coordinates back to original image size
+        # Scale coordinates back to original image size - one vectorized
+        # multiply per column instead of a Python loop over every word
         if scale != 1.0:
             for key in ["left", "top", "width", "height"]:
-                data[key] = [int(v * scale) for v in data[key]]
+                data[key] = (np.asarray(data[key], dtype=np.float64) * scale).astype(np.int64).tolist()
 
         # Extract all text for suggestions
         all_text = [t for t in data["text"] if t.strip()]
+        text_lower = [t.lower() if t.strip() else "" for t in data["text"]]
 
         # Cache the result (cache with original image hash, but scaled data)
-        self.cache.put(img, data, all_text)
-        return data
-
-    def _get_all_text(self, img: Image.Image) -> List[str]:
-        """Get all text detected in an image (for suggestions)."""
-        cached = self.cache.get(img)
-        if cached:
-            return cached.all_text
-
-        # Run OCR if not cached
-        self._run_ocr(img)
-        cached = self.cache.get(img)
-        return cached.all_text if cached else []
+        self.cache.put(img, data, all_text, text_lower, img_hash=key)
+        return data, all_text, text_lower
 
     def _fuzzy_match(self, target: str, text: str) -> float:
         """Calculate fuzzy match score between target and text."""
-        return SequenceMatcher(None, target.lower(), text.lower()).ratio()
+        # rapidfuzz's core is Myers' bit-parallel Levenshtein in C (one
+        # 64-bit word covers any UI label), so there is nothing to gain
+        # from a hand-rolled Python version; memoize repeated pairs
+        return _cached_ratio(target, text)
 
     def _find_suggestions(
         self, target: str, all_text: List[str], limit: int = 5
     ) -> List[str]:
         """Find similar text strings for suggestions."""
-        scored = []
-        target_lower = target.lower()
+        # OCR word lists repeat tokens heavily ("the", menu labels on
+        # every row) - dedup first so each unique candidate is scored
+        # once, the same candidate-space pruning a symmetric-delete
+        # index buys without building one per OCR result
+        candidates = list(dict.fromkeys(all_text))
+
+        # process.extract does the normalization, scoring, thresholding,
+        # and top-k selection in one pass inside C
+        matches = process.extract(
+            target,
+            candidates,
+            scorer=fuzz.ratio,
+            processor=fuzz_utils.default_process,
+            score_cutoff=30,
+            limit=limit,
+        )
+        return [text for text, _, _ in matches]
 
-        for text in all_text:
-            if not text.strip():
-                continue
-            score = self._fuzzy_match(target, text)
-            if score > 0.3:  # Minimum similarity threshold
-                scored.append((text, score))
+    @staticmethod
+    def _bbox_columns(
+        data: Dict[str, Any], offset: Tuple[int, int]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute offset-adjusted (x1, y1, x2, y2) columns for all OCR words.
 
-        # Sort by score descending
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return [text for text, _ in scored[:limit]]
+        Tesseract already hands back column arrays, so the bbox math is
+        four vectorized ops instead of four scalar ops per word.
+        """
+        x1s = np.asarray(data["left"], dtype=np.int64) + offset[0]
+        y1s = np.asarray(data["top"], dtype=np.int64) + offset[1]
+        x2s = x1s + np.asarray(data["width"], dtype=np.int64)
+        y2s = y1s + np.asarray(data["height"], dtype=np.int64)
+        return x1s, y1s, x2s, y2s
 
-    def _build_phrases(self, data: Dict[str, Any], offset: Tuple[int, int], max_words: int = 4) -> List[Dict[str, Any]]:
+    def _build_phrases(
+        self,
+        data: Dict[str, Any],
+        offset: Tuple[int, int],
+        max_words: int = 4,
+        min_words: int = 1,
+        text_lower: Optional[List[str]] = None,
+        target_tokens: Optional[frozenset] = None,
+    ) -> Tuple[List[str], List[str], np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
         Build multi-word phrases from adjacent OCR words on the same line.
 
-        Returns list of phrase candidates with their bounding boxes.
+        Returns structure-of-arrays phrase candidates: parallel lists of
+        phrase strings and their lowered forms (joined from the cached
+        `text_lower` column when given, so no per-call re-lowering), plus
+        (x1, y1, x2, y2, conf) columns in offset-adjusted image
+        coordinates. The bbox min/max/mean per phrase is
+        computed with sliding-window NumPy reductions per line instead of
+        Python min/max/sum over index lists.
+
+        `min_words` skips emitting phrases too short to ever match the
+        target - a 4-word target gains nothing from scoring every single
+        word and bigram on the screen.
+
+        `target_tokens` prunes harder: a line containing none of the
+        target's discriminating tokens gets a single whole-line candidate
+        (enough for the fuzzy fallback) instead of the full (start, length)
+        enumeration. On a busy screen where the target sits on one line,
+        that's a near-linear scan instead of lines x phrases.
         """
-        phrases = []
+        texts: List[str] = []
+        lowered: List[str] = []
+        cols: List[List[int]] = [[], [], [], [], []]  # x1, y1, x2, y2, conf
+
         n = len(data["text"])
 
         # Group words by line (same block_num, line_num)
@@ -132,35 +355,67 @@ class OCRLocator(BaseLocator):
                 lines[key] = []
             lines[key].append(i)
 
+        window = np.lib.stride_tricks.sliding_window_view
+
         # For each line, build all possible phrases up to max_words
         for line_indices in lines.values():
             # Sort by x position (left)
             line_indices.sort(key=lambda i: data["left"][i])
+            m = len(line_indices)
 
-            for start in range(len(line_indices)):
-                for length in range(1, min(max_words + 1, len(line_indices) - start + 1)):
-                    indices = line_indices[start:start + length]
-
-                    # Combine text
-                    phrase_text = " ".join(data["text"][i] for i in indices)
-
-                    # Combine bounding box
-                    x1 = min(data["left"][i] for i in indices) + offset[0]
-                    y1 = min(data["top"][i] for i in indices) + offset[1]
-                    x2 = max(data["left"][i] + data["width"][i] for i in indices) + offset[0]
-                    y2 = max(data["top"][i] + data["height"][i] for i in indices) + offset[1]
-
-                    # Average confidence
-                    avg_conf = sum(int(data["conf"][i]) for i in indices) // len(indices)
-
-                    phrases.append({
-                        "text": phrase_text,
-                        "bbox": BoundingBox(x1, y1, x2, y2),
-                        "confidence": avg_conf,
-                        "word_count": length,
-                    })
+            words = [data["text"][i] for i in line_indices]
+            if text_lower is not None:
+                words_lower = [text_lower[i] for i in line_indices]
+            else:
+                words_lower = [w.lower() for w in words]
+            lefts = np.fromiter((data["left"][i] for i in line_indices), dtype=np.int64, count=m)
+            tops = np.fromiter((data["top"][i] for i in line_indices), dtype=np.int64, count=m)
+            rights = lefts + np.fromiter((data["width"][i] for i in line_indices), dtype=np.int64, count=m)
+            bottoms = tops + np.fromiter((data["height"][i] for i in line_indices), dtype=np.int64, count=m)
+            confs = np.fromiter((int(data["conf"][i]) for i in line_indices), dtype=np.int64, count=m)
+
+            if target_tokens is not None:
+                line_join = " ".join(words_lower)
+                # Substring containment (not set equality) so trailing
+                # punctuation in OCR words doesn't hide a real hit
+                if not any(tok in line_join for tok in target_tokens):
+                    texts.append(" ".join(words))
+                    lowered.append(line_join)
+                    cols[0].append(int(lefts[0]) + offset[0])
+                    cols[1].append(int(tops.min()) + offset[1])
+                    cols[2].append(int(rights.max()) + offset[0])
+                    cols[3].append(int(bottoms.max()) + offset[1])
+                    cols[4].append(int(confs.mean()))
+                    continue
 
-        return phrases
+            conf_cum = np.concatenate(([0], np.cumsum(confs)))
+
+            for length in range(min_words, min(max_words, m) + 1):
+                # One vectorized pass per phrase length: sliding-window
+                # min/max over the line's columns covers every start at once
+                starts = m - length + 1
+                texts.extend(
+                    " ".join(words[s:s + length]) for s in range(starts)
+                )
+                lowered.extend(
+                    " ".join(words_lower[s:s + length]) for s in range(starts)
+                )
+                # Words are left-sorted, so x1 is just the first word's left
+                cols[0].extend(lefts[:starts] + offset[0])
+                cols[1].extend(window(tops, length).min(axis=1) + offset[1])
+                cols[2].extend(window(rights, length).max(axis=1) + offset[0])
+                cols[3].extend(window(bottoms, length).max(axis=1) + offset[1])
+                cols[4].extend((conf_cum[length:] - conf_cum[:-length]) // length)
+
+        return (
+            texts,
+            lowered,
+            np.asarray(cols[0], dtype=np.int64),
+            np.asarray(cols[1], dtype=np.int64),
+            np.asarray(cols[2], dtype=np.int64),
+            np.asarray(cols[3], dtype=np.int64),
+            np.asarray(cols[4], dtype=np.int64),
+        )
 
     def locate(
         self,
@@ -190,67 +445,125 @@ class OCRLocator(BaseLocator):
         cropped, offset = self.regions.crop_image(img, region)
 
         # Run OCR
-        data = self._run_ocr(cropped)
+        data, all_text, data_lower = self._run_ocr(cropped)
 
+        # Target-side normalization happens exactly once per call - the
+        # scoring paths below reuse these instead of re-lowering/splitting
         target_lower = target.lower()
-        target_word_count = len(target.split())
+        target_tokens = target_lower.split()
+        target_word_count = len(target_tokens)
         all_matches = []
         fuzzy_threshold = self.config.ocr_fuzzy_threshold
 
-        # Build phrases if target is multi-word
+        # Candidate texts plus parallel coordinate/confidence columns -
+        # structure-of-arrays, mirroring Tesseract's column layout
         if target_word_count > 1:
-            candidates = self._build_phrases(data, offset, max_words=target_word_count + 1)
+            texts, lowered, x1s, y1s, x2s, y2s, confs = self._build_phrases(
+                data, offset,
+                max_words=target_word_count + 1,
+                min_words=max(1, target_word_count - 1),
+                text_lower=data_lower,
+                target_tokens=frozenset(target_tokens) - STOP_WORDS or None,
+            )
         else:
-            # Single word - use original approach
-            candidates = []
-            for i, text in enumerate(data["text"]):
-                if not text.strip():
-                    continue
-                x = data["left"][i] + offset[0]
-                y = data["top"][i] + offset[1]
-                w = data["width"][i]
-                h = data["height"][i]
-                candidates.append({
-                    "text": text,
-                    "bbox": BoundingBox(x, y, x + w, y + h),
-                    "confidence": int(data["conf"][i]),
-                    "word_count": 1,
-                })
+            x1s, y1s, x2s, y2s = self._bbox_columns(data, offset)
+            keep = np.fromiter(
+                (bool(t.strip()) for t in data["text"]),
+                dtype=bool, count=len(data["text"]),
+            )
+            texts = [t for t, k in zip(data["text"], keep) if k]
+            lowered = [t for t, k in zip(data_lower, keep) if k]
+            x1s, y1s, x2s, y2s = x1s[keep], y1s[keep], x2s[keep], y2s[keep]
+            confs = np.fromiter(
+                (int(c) for c in data["conf"]),
+                dtype=np.int64, count=len(data["text"]),
+            )[keep]
+
+        # Fast path: a confident exact hit makes substring and fuzzy
+        # scoring moot - most locates are for text that is literally on
+        # screen, so this skips the whole fuzzy pass on the common path
+        exact = np.fromiter(
+            (t == target_lower for t in lowered),
+            dtype=np.bool_, count=len(lowered),
+        )
+        hits = np.flatnonzero(exact)
+        if hits.size and int(confs[hits].max()) >= 90:
+            scores = exact.astype(np.float32)
+        else:
+            scores = np.zeros(len(lowered), dtype=np.float32)
+
+            # Substring pre-filter: one compiled-regex scan over a joined
+            # corpus replaces a Python containment test per candidate.
+            # \x01 can't appear in the target, so a match never spans the
+            # separator; match positions map back to candidate indices via
+            # a binary search over cumulative lengths.
+            corpus = "\x01".join(lowered)
+            match_pos = {
+                m.start() for m in re.finditer(re.escape(target_lower), corpus)
+            }
+            if match_pos:
+                bounds = np.cumsum(np.fromiter(
+                    (len(t) + 1 for t in lowered),
+                    dtype=np.int64, count=len(lowered),
+                ))
+                for pos in match_pos:
+                    i = int(np.searchsorted(bounds, pos, side="right"))
+                    scores[i] = 1.0 if lowered[i] == target_lower else 0.95
+            elif fuzzy and lowered:
+                # Nothing contains the target literally - fall through to
+                # the batched C scorers. ratio covers typo-level
+                # similarity; partial_ratio covers containment, but is
+                # scaled by min(len)/max(len) - a 4-char word inside a
+                # 9-char target scores ~100 raw, which would let a
+                # fragment on another line outrank a near-exact match.
+                # score_cutoff lets the C scorer bail out of the DP matrix
+                # early for candidates that can't reach the threshold
+                cutoff = fuzzy_threshold * 100.0
+                full = process.cdist(
+                    [target_lower], lowered, scorer=fuzz.ratio,
+                    score_cutoff=cutoff, dtype=np.float32,
+                )[0]
+                partial = process.cdist(
+                    [target_lower], lowered, scorer=fuzz.partial_ratio,
+                    score_cutoff=cutoff, dtype=np.float32,
+                )[0]
+                lens = np.fromiter(
+                    (len(t) for t in lowered),
+                    dtype=np.float32, count=len(lowered),
+                )
+                target_len = float(len(target_lower))
+                len_ratio = (
+                    np.minimum(lens, target_len)
+                    / np.maximum(np.maximum(lens, target_len), 1.0)
+                )
+                scores = np.maximum(full, partial * len_ratio) / 100.0
+            hits = np.flatnonzero(scores >= fuzzy_threshold)
+
+        weighted = scores * (confs.astype(np.float32) / 100.0)
 
-        # Search through candidates
-        for cand in candidates:
-            text = cand["text"]
-            text_lower = text.lower()
-            conf = cand["confidence"]
-
-            # Exact match
-            if target_lower == text_lower:
-                score = 1.0
-            # Substring match
-            elif target_lower in text_lower:
-                score = 0.95
-            # Fuzzy match (if enabled)
-            elif fuzzy:
-                score = self._fuzzy_match(target, text)
-            else:
-                score = 0
+        elapsed_ms = (time.time() - start) * 1000
 
-            if score >= fuzzy_threshold:
+        if hits.size:
+            # Best match by weighted score; BoundingBox objects are only
+            # materialized for rows that passed the threshold
+            best = hits[np.argmax(weighted[hits])]
+            best_match = {
+                "text": texts[best],
+                "bbox": BoundingBox(int(x1s[best]), int(y1s[best]), int(x2s[best]), int(y2s[best])),
+                "confidence": int(confs[best]),
+            }
+
+            # Contract: all_matches is sorted top-to-bottom (by bbox y1) so
+            # downstream verification can rely on reading order without re-sorting
+            for i in hits[np.argsort(y1s[hits], kind="stable")]:
                 all_matches.append({
-                    "text": text,
-                    "bbox": cand["bbox"],
-                    "confidence": conf,
-                    "match_score": score,
-                    "weighted_score": score * (conf / 100),
+                    "text": texts[i],
+                    "bbox": BoundingBox(int(x1s[i]), int(y1s[i]), int(x2s[i]), int(y2s[i])),
+                    "confidence": int(confs[i]),
+                    "match_score": float(scores[i]),
+                    "weighted_score": float(weighted[i]),
                 })
 
-        elapsed_ms = (time.time() - start) * 1000
-
-        if all_matches:
-            # Sort by weighted score, best first
-            all_matches.sort(key=lambda x: x["weighted_score"], reverse=True)
-            best_match = all_matches[0]
-
             result = LocatorResult(
                 found=True,
                 element=best_match["text"],
@@ -259,13 +572,13 @@ class OCRLocator(BaseLocator):
                 method=LocatorMethod.OCR,
                 time_ms=elapsed_ms,
             )
-            # Attach all matches for verification if needed
+            # Attach all matches (sorted top-to-bottom) for verification if needed
             result.all_matches = all_matches
             return result
 
-        # Not found - get suggestions
-        all_text = self._get_all_text(cropped)
-        suggestions = self._find_suggestions(target, all_text)
+        # Not found - get suggestions from the words already in hand (no
+        # second cache lookup, no second image hash)
+        suggestions = self._find_suggestions(target_lower, all_text)
 
         return LocatorResult(
             found=False,
@@ -277,6 +590,55 @@ class OCRLocator(BaseLocator):
             suggestions=suggestions,
         )
 
+    @property
+    def _ocr_pool(self) -> ThreadPoolExecutor:
+        """Lazily-created worker pool for concurrent region OCR."""
+        if self._pool is None:
+            # Tesseract parallelizes internally with OpenMP - pin it to one
+            # thread so it doesn't oversubscribe against the outer pool
+            os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+            self._pool = ThreadPoolExecutor(
+                max_workers=max(1, (os.cpu_count() or 2) // 2),
+                thread_name_prefix="ocr",
+            )
+        return self._pool
+
+    def locate_many(
+        self,
+        img: Image.Image,
+        targets: List[Tuple[str, str]],
+        fuzzy: bool = True,
+    ) -> List[LocatorResult]:
+        """
+        Find several texts on one screenshot, OCRing regions concurrently.
+
+        Tesseract runs outside the GIL (in-process tesserocr releases it;
+        pytesseract forks), so distinct regions scale across cores. Each
+        unique region is OCR'd once - the results land in the OCR cache
+        and the per-target locate calls below are pure cache hits.
+
+        Args:
+            img: Screenshot as PIL Image
+            targets: List of (target text, region name) pairs
+            fuzzy: Allow fuzzy matching (default True)
+
+        Returns:
+            LocatorResults in the same order as targets
+        """
+        if not targets:
+            return []
+
+        unique_regions = list(dict.fromkeys(region for _, region in targets))
+        if len(unique_regions) > 1:
+            crops = [self.regions.crop_image(img, r)[0] for r in unique_regions]
+            # Consume the iterator so OCR errors surface here, per crop
+            list(self._ocr_pool.map(self._run_ocr, crops))
+
+        return [
+            self.locate(img, target, region=region, fuzzy=fuzzy)
+            for target, region in targets
+        ]
+
     def get_all_text_in_region(
         self, img: Image.Image, region: str = "full"
     ) -> List[Dict[str, Any]]:
@@ -286,23 +648,15 @@ class OCRLocator(BaseLocator):
         Useful for debugging and exploration.
         """
         cropped, offset = self.regions.crop_image(img, region)
-        data = self._run_ocr(cropped)
-
-        elements = []
-        for i, text in enumerate(data["text"]):
-            if not text.strip():
-                continue
+        data, _, _ = self._run_ocr(cropped)
 
-            conf = int(data["conf"][i])
-            x = data["left"][i] + offset[0]
-            y = data["top"][i] + offset[1]
-            w = data["width"][i]
-            h = data["height"][i]
-
-            elements.append({
+        x1s, y1s, x2s, y2s = self._bbox_columns(data, offset)
+        return [
+            {
                 "text": text,
-                "bbox": BoundingBox(x, y, x + w, y + h),
-                "confidence": conf,
-            })
-
-        return elements
+                "bbox": BoundingBox(int(x1s[i]), int(y1s[i]), int(x2s[i]), int(y2s[i])),
+                "confidence": int(data["conf"][i]),
+            }
+            for i, text in enumerate(data["text"])
+            if text.strip()
+        ]
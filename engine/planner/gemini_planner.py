@@ -2,15 +2,21 @@
 Gemini-based task planner.
 """
 
+import asyncio
+import copy
+import functools
 import json
-import re
-from typing import Optional, List
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Tuple
 from PIL import Image
-import google.generativeai as genai
 
 from engine.core.types import Step, Plan
 from engine.core.exceptions import PlanningError
-from engine.utils.image import resize_for_api
+from engine.cache.llm_cache import LLMCache, get_llm_cache
+from engine.utils.image import jpeg_part_for_api, phash
 from engine.utils.retry import with_retry, RetryConfig
 from engine.config import Config, get_config
 
@@ -65,6 +71,97 @@ Respond with JSON only:
 {{"visible": true/false, "exact_text": "the exact text if visible", "confidence": 0-100}}'''
 
 
+# Templates split around their holes once at import - plain concatenation
+# skips str.format's template parser on every planning call
+_PLAN_HEAD, _PLAN_TAIL = (
+    part.replace("{{", "{").replace("}}", "}") for part in PLAN_PROMPT.split("{task}")
+)
+_VALIDATE_HEAD, _rest = VALIDATE_PROMPT.split("{target}")
+_VALIDATE_MID, _VALIDATE_TAIL = (
+    part.replace("{{", "{").replace("}}", "}") for part in _rest.split("{region}")
+)
+del _rest
+
+
+@functools.lru_cache(maxsize=128)
+def _build_plan_prompt(task: str) -> str:
+    """Assemble the planning prompt, memoized per unique task string."""
+    return _PLAN_HEAD + task + _PLAN_TAIL
+
+
+def _build_validate_prompt(target: str, region: str) -> str:
+    """Assemble the validation prompt from the pre-split template."""
+    return _VALIDATE_HEAD + target + _VALIDATE_MID + region + _VALIDATE_TAIL
+
+
+# Valid step quads: quadrant numbers 1-4 or half-screen names
+_VALID_QUADS = frozenset({1, 2, 3, 4, "top", "bottom", "left", "right"})
+
+
+# google.generativeai pulls in gRPC and protobuf - hundreds of ms of
+# import time - so it's loaded on first use, not at module import (the
+# same pattern the icon locator uses)
+_genai = None
+_genai_configured = False
+
+
+def _load_genai(api_key: Optional[str] = None):
+    """Import google.generativeai on first use and configure it once."""
+    global _genai, _genai_configured
+    if _genai is None:
+        import google.generativeai as genai
+        _genai = genai
+    if api_key and not _genai_configured:
+        _genai.configure(api_key=api_key)
+        _genai_configured = True
+    return _genai
+
+
+# Process-level model handles, shared by every planner and validator
+# instance - FastAPI may construct several per worker, and SDK handle
+# init shouldn't be paid more than once per model name
+_MODEL_CACHE: dict = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def get_generative_model(name: str):
+    """Get or create a process-wide GenerativeModel handle by name."""
+    model = _MODEL_CACHE.get(name)
+    if model is None:
+        with _MODEL_LOCK:
+            model = _MODEL_CACHE.get(name)
+            if model is None:
+                model = _MODEL_CACHE[name] = _load_genai().GenerativeModel(name)
+    return model
+
+
+# orjson parses typical Gemini payloads several times faster than the
+# stdlib; fall back silently when it isn't installed
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+def _strip_fence(text: str) -> str:
+    """
+    Remove markdown code fences from a model response.
+
+    Gemini usually returns bare JSON - the leading-brace check lets that
+    common case skip the trimming entirely.
+    """
+    text = text.strip()
+    if text and text[0] in "{[":
+        return text
+    if text.startswith("```"):
+        start = text.find("\n") + 1
+        end = text.rfind("```")
+        return text[start : end if end >= start else len(text)].strip()
+    return text
+
+
 class GeminiPlanner:
     """
     Task planner using Gemini vision model.
@@ -72,26 +169,124 @@ class GeminiPlanner:
     Takes a screenshot and task description, returns a plan with steps.
     """
 
+    # Cached Gemini verdicts expire after this many seconds - screens
+    # that look identical but are minutes apart shouldn't share a plan
+    CACHE_TTL = 60.0
+    CACHE_SIZE = 64
+
     def __init__(self, config: Optional[Config] = None):
         self.config = config or get_config()
         self._planner_model = None  # Smart model for planning
         self._fast_model = None     # Fast model for QA
 
+        # LRU caches over the network boundary: replaying a task or
+        # re-validating the same screen recurs constantly in automation
+        # loops, and a hit saves a full Gemini round trip. Keys use a
+        # perceptual screen fingerprint so cursor-level pixel noise
+        # still hits.
+        self._plan_cache: "OrderedDict[Tuple, Tuple[float, List[Step]]]" = OrderedDict()
+        self._validate_cache: "OrderedDict[Tuple, Tuple[float, dict]]" = OrderedDict()
+
+        # Single background worker for the first-step QA round trip (lazy)
+        self._qa_pool: Optional[ThreadPoolExecutor] = None
+
+        # Exact-payload response cache, persisted across runs - replayed
+        # sessions skip the network entirely after the first pass
+        self._llm_cache = get_llm_cache()
+
+        # Memoized resize+encode of recent screenshots, so planning and
+        # validating the same frame downscale a 4K capture only once
+        self._part_cache: "OrderedDict[Tuple, Tuple[Image.Image, dict]]" = OrderedDict()
+
         if self.config.google_api_key:
-            genai.configure(api_key=self.config.google_api_key)
+            _load_genai(self.config.google_api_key)
+
+    def _prepared_part(
+        self, img: Image.Image, max_width: int = 1280, grayscale: bool = False
+    ) -> dict:
+        """
+        Resize and JPEG-encode a screenshot for the API, memoized per frame.
+
+        Keyed on object identity plus size, so the same live PIL image can
+        feed planning, validation, and refinement with a single resample.
+        Each entry pins its source image and hits check identity -
+        successive screenshots share one size, so a recycled id would
+        otherwise silently return a previous frame's bytes.
+        """
+        key = (id(img), img.size, max_width, grayscale)
+        hit = self._part_cache.get(key)
+        if hit is not None and hit[0] is img:
+            self._part_cache.move_to_end(key)
+            return hit[1]
+
+        part = jpeg_part_for_api(img, max_width=max_width, grayscale=grayscale)
+        self._part_cache[key] = (img, part)
+        if len(self._part_cache) > 4:
+            self._part_cache.popitem(last=False)
+        return part
+
+    @staticmethod
+    def _content_for(prompt: str, image_part: dict):
+        """
+        Wrap a prompt and encoded image as a prebuilt proto Content.
+
+        Handing the SDK a Content skips its per-item isinstance dispatch;
+        the image's Part is stashed on the dict so repeated calls against
+        the same payload (plan, then validate, then refine) build it once.
+        """
+        genai = _load_genai()
+        img_proto = image_part.get("_proto")
+        if img_proto is None:
+            img_proto = genai.protos.Part(
+                inline_data=genai.protos.Blob(
+                    mime_type=image_part["mime_type"], data=image_part["data"]
+                )
+            )
+            image_part["_proto"] = img_proto
+        return genai.protos.Content(
+            parts=[genai.protos.Part(text=prompt), img_proto]
+        )
+
+    @staticmethod
+    def _screen_key(img: Image.Image) -> int:
+        """
+        Perceptual fingerprint of a screenshot (64-bit DCT pHash).
+
+        Unlike an exact pixel digest, frames differing only by caret
+        blink or clock ticks key identically, so plan and validation
+        caches keep hitting across an agent loop's screenshots.
+        """
+        return phash(img)
+
+    def _cache_get(self, cache: "OrderedDict", key: Tuple):
+        """Fetch from a TTL'd LRU cache; expired entries count as misses."""
+        hit = cache.get(key)
+        if hit is None:
+            return None
+        ts, value = hit
+        if time.time() - ts > self.CACHE_TTL:
+            del cache[key]
+            return None
+        cache.move_to_end(key)
+        return value
+
+    def _cache_put(self, cache: "OrderedDict", key: Tuple, value) -> None:
+        cache[key] = (time.time(), value)
+        if len(cache) > self.CACHE_SIZE:
+            cache.popitem(last=False)
 
     @property
     def planner_model(self):
         """Lazy-load smart Gemini model for planning."""
         if self._planner_model is None:
-            self._planner_model = genai.GenerativeModel(self.config.gemini_planner_model)
+            self._planner_model = get_generative_model(self.config.gemini_planner_model)
         return self._planner_model
 
     @property
     def fast_model(self):
         """Lazy-load fast Gemini model for QA/validation."""
         if self._fast_model is None:
-            self._fast_model = genai.GenerativeModel(self.config.gemini_fast_model)
+            self._fast_model = get_generative_model(self.config.gemini_fast_model)
         return self._fast_model
 
     @property
@@ -101,19 +296,12 @@ class GeminiPlanner:
 
     def _parse_response(self, text: str) -> tuple[List[dict], str]:
         """Parse JSON response from Gemini. Returns (steps, analysis)."""
-        # Strip markdown code blocks if present
-        text = text.strip()
-        if text.startswith("```"):
-            lines = text.split("\n")
-            # Remove first and last lines (```json and ```)
-            text = "\n".join(lines[1:-1])
-
         try:
-            data = json.loads(text)
+            data = _json_loads(_strip_fence(text))
             analysis = data.get("analysis", "")
             steps = data.get("steps", [])
             return steps, analysis
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             raise PlanningError(
                 task="parse",
                 message=f"Invalid JSON response: {e}",
@@ -124,21 +312,58 @@ class GeminiPlanner:
         img: Image.Image,
         target: str,
         region: str,
+        image_part: Optional[dict] = None,
     ) -> dict:
-        """Validate that a target is actually visible on screen (uses fast model)."""
-        img_small = resize_for_api(img, max_width=1200)
-        prompt = VALIDATE_PROMPT.format(target=target, region=region)
+        """
+        Validate that a target is actually visible on screen (uses fast model).
+
+        Pass `image_part` (from jpeg_part_for_api) to reuse an encode the
+        caller already paid for - the planner validates the same screenshot
+        it just planned against, so a second downscale of the same frame
+        would be pure waste.
+        """
+        cache_key = (target, region, self._screen_key(img))
+        cached = self._cache_get(self._validate_cache, cache_key)
+        if cached is not None:
+            return cached
+
+        if image_part is None:
+            # Visibility is a coarse question: a small grayscale frame is
+            # enough, and roughly a third of the color payload
+            if self.config.validate_grayscale:
+                image_part = self._prepared_part(img, max_width=800, grayscale=True)
+            else:
+                image_part = self._prepared_part(img)
+        prompt = _build_validate_prompt(target, region)
+        llm_key = LLMCache.compute_key(
+            prompt, image_part["data"], self.config.gemini_fast_model
+        )
 
         try:
-            response = self.fast_model.generate_content([prompt, img_small])
-            text = response.text.strip()
-            if text.startswith("```"):
-                lines = text.split("\n")
-                text = "\n".join(lines[1:-1])
-            return json.loads(text)
+            text = self._llm_cache.get(llm_key)
+            if text is None:
+                response = self.fast_model.generate_content(self._content_for(prompt, image_part))
+                text = response.text
+                self._llm_cache.put(llm_key, text)
+            result = _json_loads(_strip_fence(text))
         except Exception:
             return {"visible": True, "confidence": 50}  # Assume visible on error
 
+        self._cache_put(self._validate_cache, cache_key, result)
+        return result
+
+    def _validate_first_step(
+        self, img: Image.Image, step: Step, image_part: Optional[dict] = None
+    ) -> dict:
+        """Background QA: check the first step's target and warn if absent."""
+        validation = self.validate_target(
+            img, step.target_text, step.region, image_part=image_part
+        )
+        if not validation.get("visible", True):
+            print(f"  Warning: '{step.target_text}' may not be visible")
+            # Could regenerate plan here, but for now just warn
+        return validation
+
     def _validate_step(self, step_data: dict, index: int) -> Step:
         """Validate and convert step data to Step object."""
         required = ["instruction", "target_text"]
@@ -152,9 +377,7 @@ class GeminiPlanner:
         is_icon = step_data.get("is_icon", False)
         quad = step_data.get("quad")
 
-        # Validate quad - can be 1-4 or "top", "bottom", "left", "right"
-        valid_quads = [1, 2, 3, 4, "top", "bottom", "left", "right"]
-        if quad is not None and quad not in valid_quads:
+        if quad is not None and quad not in _VALID_QUADS:
             quad = None
 
         return Step(
@@ -184,11 +407,20 @@ class GeminiPlanner:
         """
         max_steps = max_steps or self.config.plan_max_steps
 
-        # Resize image - HD resolution for faster API calls
-        img_small = resize_for_api(img, max_width=1280)
+        # Same task on the same-looking screen -> same plan, no round trip
+        cache_key = (task, self._screen_key(img))
+        cached_steps = self._cache_get(self._plan_cache, cache_key)
+        if cached_steps is not None:
+            # Deep copy: runners mutate Step.completed/.result in place,
+            # so handing out the cached objects would leak one session's
+            # progress into the next hit (and race concurrent sessions)
+            return Plan(task=task, steps=copy.deepcopy(cached_steps))
+
+        # Resize + JPEG-encode - HD resolution, small upload, faster API calls
+        image_part = self._prepared_part(img)
 
         # Build prompt
-        prompt = PLAN_PROMPT.format(task=task)
+        prompt = _build_plan_prompt(task)
 
         # Retry config
         retry_config = RetryConfig(
@@ -198,18 +430,121 @@ class GeminiPlanner:
 
         @with_retry(retry_config)
         def _call_gemini():
-            response = self.model.generate_content([prompt, img_small])
-            return response.text
+            # stream=True delivers tokens as they are generated instead of
+            # after the server assembles the full completion, shaving the
+            # tail off long plan responses
+            response = self.model.generate_content(
+                self._content_for(prompt, image_part), stream=True
+            )
+            return "".join(chunk.text for chunk in response)
 
-        try:
-            response_text = _call_gemini()
-        except Exception as e:
-            raise PlanningError(
-                task=task,
-                message=f"Gemini API failed: {e}",
-                cause=e,
+        # Exact payload seen before (possibly in a previous run) - the
+        # persisted response is what Gemini would return, minus the RTT
+        llm_key = LLMCache.compute_key(
+            prompt, image_part["data"], self.config.gemini_planner_model
+        )
+        response_text = self._llm_cache.get(llm_key)
+        if response_text is None:
+            try:
+                response_text = _call_gemini()
+            except Exception as e:
+                raise PlanningError(
+                    task=task,
+                    message=f"Gemini API failed: {e}",
+                    cause=e,
+                )
+            self._llm_cache.put(llm_key, response_text)
+
+        return self._build_plan(task, response_text, img, cache_key, image_part)
+
+    async def generate_plan_async(
+        self,
+        img: Image.Image,
+        task: str,
+        max_steps: Optional[int] = None,
+    ) -> Plan:
+        """
+        Async variant of generate_plan.
+
+        Uses the SDK's async client so the thread (and event loop) stays
+        free during the network wait and any retry backoff - API servers
+        and concurrent pipelines should prefer this entry point.
+        """
+        max_steps = max_steps or self.config.plan_max_steps
+
+        cache_key = (task, self._screen_key(img))
+        cached_steps = self._cache_get(self._plan_cache, cache_key)
+        if cached_steps is not None:
+            # Deep copy: runners mutate Step.completed/.result in place,
+            # so handing out the cached objects would leak one session's
+            # progress into the next hit (and race concurrent sessions)
+            return Plan(task=task, steps=copy.deepcopy(cached_steps))
+
+        image_part = self._prepared_part(img)
+        prompt = _build_plan_prompt(task)
+
+        retry_config = RetryConfig(
+            max_attempts=self.config.max_retries,
+            base_delay=self.config.retry_base_delay,
+        )
+
+        @with_retry(retry_config)
+        async def _call_gemini():
+            response = await self.model.generate_content_async(
+                self._content_for(prompt, image_part), stream=True
             )
+            return "".join([chunk.text async for chunk in response])
 
+        llm_key = LLMCache.compute_key(
+            prompt, image_part["data"], self.config.gemini_planner_model
+        )
+        response_text = self._llm_cache.get(llm_key)
+        if response_text is None:
+            try:
+                response_text = await _call_gemini()
+            except Exception as e:
+                raise PlanningError(
+                    task=task,
+                    message=f"Gemini API failed: {e}",
+                    cause=e,
+                )
+            self._llm_cache.put(llm_key, response_text)
+
+        return self._build_plan(task, response_text, img, cache_key, image_part)
+
+    async def generate_plans_batch(
+        self,
+        imgs: List[Image.Image],
+        tasks: List[str],
+        max_steps: Optional[int] = None,
+        max_concurrency: int = 10,
+    ) -> List[Plan]:
+        """
+        Generate plans for several (screenshot, task) pairs concurrently.
+
+        All Gemini round trips overlap on the event loop, bounded by a
+        semaphore so a large batch can't blow through rate limits.
+        """
+        if len(imgs) != len(tasks):
+            raise ValueError("imgs and tasks must have the same length")
+
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _one(img: Image.Image, task: str) -> Plan:
+            async with sem:
+                return await self.generate_plan_async(img, task, max_steps=max_steps)
+
+        return list(await asyncio.gather(*(_one(i, t) for i, t in zip(imgs, tasks))))
+
+    def _build_plan(
+        self,
+        task: str,
+        response_text: str,
+        img: Image.Image,
+        cache_key: Tuple,
+        image_part: Optional[dict] = None,
+    ) -> Plan:
+        """Parse a planner response into a Plan, cache it, and spawn QA."""
         # Parse response
         try:
             steps_data, analysis = self._parse_response(response_text)
@@ -247,15 +582,25 @@ class GeminiPlanner:
                     cause=e,
                 )
 
-        # QA: Validate first step target is actually visible
+        # Cache a pristine deep copy - the returned plan's steps get
+        # mutated by the runner and must not alias the cached ones
+        self._cache_put(self._plan_cache, cache_key, copy.deepcopy(steps))
+        plan = Plan(task=task, steps=list(steps))
+
+        # QA: check the first step's target in the background. The caller
+        # almost always OCRs this same screenshot next, so the extra
+        # Gemini round trip hides behind that work instead of delaying
+        # the plan. Consumers that care await plan.validation_future.
         if steps:
-            first_step = steps[0]
-            validation = self.validate_target(img, first_step.target_text, first_step.region)
-            if not validation.get("visible", True):
-                print(f"  Warning: '{first_step.target_text}' may not be visible")
-                # Could regenerate plan here, but for now just warn
+            if self._qa_pool is None:
+                self._qa_pool = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="plan-qa"
+                )
+            plan.validation_future = self._qa_pool.submit(
+                self._validate_first_step, img, steps[0], image_part
+            )
 
-        return Plan(task=task, steps=steps)
+        return plan
 
     def refine_plan(
         self,
@@ -284,11 +629,26 @@ Problem: {feedback}
 Generate a revised plan that addresses this issue.
 Return JSON with "steps" array only, same format as before.'''
 
-        img_small = resize_for_api(img, max_width=1200)
+        image_part = self._prepared_part(img)
+
+        # The prompt embeds the plan JSON and feedback, so the payload key
+        # covers everything that could change the answer
+        llm_key = LLMCache.compute_key(
+            prompt, image_part["data"], self.config.gemini_planner_model
+        )
 
         try:
-            response = self.model.generate_content([prompt, img_small])
-            steps_data = self._parse_response(response.text)
+            response_text = self._llm_cache.get(llm_key)
+            if response_text is None:
+                response = self.model.generate_content(self._content_for(prompt, image_part))
+                response_text = response.text
+                self._llm_cache.put(llm_key, response_text)
+            steps_data, _analysis = self._parse_response(response_text)
+            if not steps_data:
+                raise PlanningError(
+                    task=plan.task,
+                    message="Refine produced no steps",
+                )
 
             steps = []
             for i, step_data in enumerate(steps_data):
@@ -297,6 +657,8 @@ Return JSON with "steps" array only, same format as before.'''
 
             return Plan(task=plan.task, steps=steps)
 
+        except PlanningError:
+            raise
         except Exception as e:
             raise PlanningError(
                 task=plan.task,
@@ -2,16 +2,24 @@
 Plan and step validation utilities.
 """
 
+import math
+import re
 from typing import Optional, List, Tuple
-from PIL import Image
-import google.generativeai as genai
+
+import numpy as np
+from PIL import Image, ImageDraw
 
 from engine.core.types import Step, Plan, LocatorResult, BoundingBox
+from engine.planner.gemini_planner import _load_genai, get_generative_model
+from engine.utils.image import jpeg_part_for_api
 from engine.config import Config, get_config
 
 # Valid region names (includes dynamic "window" region)
 VALID_REGIONS = {"full", "window", "menu_bar", "dock"}
 
+# First integer in a model answer ("tile 12 looks right" -> 12)
+_DIGIT_RE = re.compile(r"\d+")
+
 
 class PlanValidator:
     """
@@ -25,13 +33,13 @@ class PlanValidator:
         self._model = None
 
         if self.config.google_api_key:
-            genai.configure(api_key=self.config.google_api_key)
+            _load_genai(self.config.google_api_key)
 
     @property
     def model(self):
-        """Lazy-load Gemini model."""
+        """Lazy-load Gemini model (shared process-wide by model name)."""
         if self._model is None:
-            self._model = genai.GenerativeModel(self.config.gemini_model)
+            self._model = get_generative_model(self.config.gemini_model)
         return self._model
 
     def validate_step(self, step: Step) -> List[str]:
@@ -63,35 +71,44 @@ class PlanValidator:
         Returns:
             Tuple of (is_valid, list of warnings)
         """
-        all_warnings = []
-
         if not plan.steps:
             return False, ["Plan has no steps"]
 
+        # Plan-level warnings decide validity; step warnings are advisory.
+        # Tracking them separately avoids re-scanning the combined list.
+        plan_warnings = []
+        all_warnings = []
+
         if len(plan.steps) > 10:
-            all_warnings.append(f"Plan has many steps ({len(plan.steps)}), may be over-complicated")
+            warning = f"Plan has many steps ({len(plan.steps)}), may be over-complicated"
+            plan_warnings.append(warning)
+            all_warnings.append(warning)
 
         for i, step in enumerate(plan.steps):
             step_warnings = self.validate_step(step)
             for w in step_warnings:
                 all_warnings.append(f"Step {i+1}: {w}")
 
-        is_valid = len([w for w in all_warnings if not w.startswith("Step")]) == 0
-        return is_valid, all_warnings
+        return not plan_warnings, all_warnings
 
     def disambiguate(
         self,
         img: Image.Image,
         step: Step,
         candidates: List[LocatorResult],
+        max_check: int = 5,
     ) -> Optional[LocatorResult]:
         """
         Disambiguate between multiple matching elements using Gemini.
 
+        All candidate crops go out in a single multi-image request, so the
+        cost is one network round-trip regardless of candidate count.
+
         Args:
             img: Screenshot
             step: The step being executed
             candidates: List of possible matches
+            max_check: Max candidates to send to Gemini (highest confidence first)
 
         Returns:
             Best matching LocatorResult, or None if can't disambiguate
@@ -102,43 +119,57 @@ class PlanValidator:
         if len(candidates) == 1:
             return candidates[0]
 
-        # Prepare crops of each candidate
+        # Keep only the most confident candidates - more than a handful of
+        # crops bloats the request without improving the pick
+        if len(candidates) > max_check:
+            candidates = sorted(
+                candidates, key=lambda r: r.confidence, reverse=True
+            )[:max_check]
+
+        # Prepare crops of each candidate - expand/clamp all boxes in one
+        # vectorized pass rather than allocating BoundingBoxes per candidate
+        with_bbox = [(i, r.bbox) for i, r in enumerate(candidates) if r.bbox]
         crops = []
-        for i, result in enumerate(candidates):
-            if result.bbox:
-                # Expand bbox slightly for context
-                bbox = result.bbox.expand(20).clamp(img.width, img.height)
-                crop = img.crop((bbox.x1, bbox.y1, bbox.x2, bbox.y2))
-                crops.append((i, crop))
+        if with_bbox:
+            coords = np.array(
+                [[b.x1, b.y1, b.x2, b.y2] for _, b in with_bbox], dtype=np.int64
+            )
+            coords = BoundingBox.batch_expand_clamp(coords, 20, img.width, img.height)
+            crops = [
+                (i, img.crop(tuple(row)))
+                for (i, _), row in zip(with_bbox, coords.tolist())
+            ]
 
         if not crops:
             return candidates[0]
 
+        # Composite all crops into one labeled grid so the request carries
+        # a single image instead of N separately encoded (and separately
+        # tokenized) attachments
+        grid = self._build_crop_grid(crops)
+
         # Ask Gemini to pick the best one
         prompt = f'''Task: {step.instruction}
 Target: "{step.target_text}"
 
-I have {len(crops)} possible matches. Which one is correct for this task?
-The images are numbered 0 to {len(crops)-1}.
+I have {len(crops)} possible matches, shown as tiles in a single grid image.
+Each tile is labeled with its number (0 to {len(crops)-1}) in the top-left corner,
+reading left-to-right, top-to-bottom.
 
 Reply with just the number (0, 1, 2, etc.) of the best match.'''
 
-        # Prepare content with all crops
-        content = [prompt]
-        for i, crop in crops:
-            content.append(f"Option {i}:")
-            content.append(crop)
-
         try:
-            response = self.model.generate_content(content)
+            response = self.model.generate_content(
+                [prompt, jpeg_part_for_api(grid)]
+            )
             answer = response.text.strip()
 
-            # Extract number from response
-            for char in answer:
-                if char.isdigit():
-                    idx = int(char)
-                    if 0 <= idx < len(candidates):
-                        return candidates[idx]
+            # Extract number from response (multi-digit, so >=10 tiles work)
+            m = _DIGIT_RE.search(answer)
+            if m:
+                idx = int(m.group())
+                if 0 <= idx < len(candidates):
+                    return candidates[idx]
 
             # Fallback to first candidate
             return candidates[0]
@@ -147,6 +178,34 @@ Reply with just the number (0, 1, 2, etc.) of the best match.'''
             # On error, return first candidate
             return candidates[0]
 
+    @staticmethod
+    def _build_crop_grid(
+        crops: List[Tuple[int, Image.Image]],
+        tile_size: int = 256,
+    ) -> Image.Image:
+        """
+        Paste candidate crops into a single square-ish labeled grid image.
+
+        Each tile keeps its candidate index drawn in the top-left corner so
+        the model's numeric answer maps straight back to `candidates`.
+        """
+        cols = math.ceil(math.sqrt(len(crops)))
+        rows = math.ceil(len(crops) / cols)
+        grid = Image.new("RGB", (cols * tile_size, rows * tile_size), "white")
+        draw = ImageDraw.Draw(grid)
+
+        for pos, (i, crop) in enumerate(crops):
+            tile = crop.copy()
+            tile.thumbnail((tile_size, tile_size))
+            x = (pos % cols) * tile_size
+            y = (pos // cols) * tile_size
+            grid.paste(tile, (x, y))
+            # Label with a contrasting backing box so it reads over any crop
+            draw.rectangle([x, y, x + 28, y + 20], fill="black")
+            draw.text((x + 6, y + 3), str(i), fill="white")
+
+        return grid
+
     def verify_result(
         self,
         img: Image.Image,
@@ -167,9 +226,12 @@ Reply with just the number (0, 1, 2, etc.) of the best match.'''
         if not result.found or not result.bbox:
             return False, 0.0
 
-        # High confidence results are assumed correct
-        if result.confidence >= 90:
+        # Most results land in the trustworthy band - only the genuinely
+        # ambiguous middle is worth a Gemini round trip
+        if result.confidence >= self.config.verify_trust_threshold:
             return True, result.confidence
+        if result.confidence < self.config.verify_reject_threshold:
+            return False, 0.0
 
         # For lower confidence, ask Gemini to verify
         bbox = result.bbox.expand(20).clamp(img.width, img.height)
@@ -184,7 +246,9 @@ Is this the correct element to click? Reply with:
 - MAYBE if unsure'''
 
         try:
-            response = self.model.generate_content([prompt, crop])
+            response = self.model.generate_content(
+                [prompt, jpeg_part_for_api(crop)]
+            )
             answer = response.text.strip().upper()
 
             if "YES" in answer:
@@ -4,15 +4,21 @@ Pytest fixtures for CONU engine tests.
 
 import os
 import pytest
-from PIL import Image
+from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 
 from engine.config import Config, set_config
 from engine.core.regions import RegionManager
 from engine.cache.ocr_cache import OCRCache
 
+# Font for rendered-text fixtures, loaded once for the whole suite
+try:
+    _TEST_FONT = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 24)
+except (OSError, IOError):
+    _TEST_FONT = ImageFont.load_default()
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def test_config():
     """Create a test configuration."""
     config = Config(
@@ -37,7 +43,7 @@ def ocr_cache():
     return OCRCache(max_size=10)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image():
     """Create a simple test image with text."""
     # Create a 800x600 white image
@@ -45,7 +51,7 @@ def sample_image():
     return img
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_with_text():
     """
     Create a test image with actual text for OCR testing.
@@ -53,18 +59,10 @@ def sample_image_with_text():
     Note: For real OCR tests, you'd use a pre-rendered image.
     This creates a simple placeholder.
     """
-    from PIL import ImageDraw, ImageFont
-
     img = Image.new("RGB", (800, 600), color="white")
     draw = ImageDraw.Draw(img)
 
-    # Draw some text
-    try:
-        # Try to use a system font
-        font = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 24)
-    except (OSError, IOError):
-        font = ImageFont.load_default()
-
+    font = _TEST_FONT
     draw.text((100, 100), "Settings", fill="black", font=font)
     draw.text((100, 150), "Appearance", fill="black", font=font)
     draw.text((100, 200), "Dark Mode", fill="black", font=font)
@@ -13,18 +13,20 @@ from io import BytesIO
 from engine.api.main import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def client():
     """Create a test client for the FastAPI app."""
     return TestClient(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_image_base64():
     """Create a sample base64-encoded image for testing."""
     img = Image.new("RGB", (100, 100), color="white")
     buffer = BytesIO()
-    img.save(buffer, format="PNG")
+    # JPEG keeps the base64 payload small and exercises the server's
+    # draft-decode fast path
+    img.save(buffer, format="JPEG")
     buffer.seek(0)
     return base64.b64encode(buffer.getvalue()).decode("utf-8")
 
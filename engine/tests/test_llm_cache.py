@@ -0,0 +1,76 @@
+"""
+Tests for the persistent LLM response cache.
+"""
+
+import pytest
+
+from engine.cache.llm_cache import LLMCache
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "llm_cache.json")
+
+
+class TestLLMCache:
+    """Tests for exact-payload LLM response caching."""
+
+    def test_compute_key_discriminates(self):
+        key = LLMCache.compute_key("prompt", b"image", "model")
+        assert key == LLMCache.compute_key("prompt", b"image", "model")
+        assert key != LLMCache.compute_key("other", b"image", "model")
+        assert key != LLMCache.compute_key("prompt", b"other", "model")
+        assert key != LLMCache.compute_key("prompt", b"image", "other")
+
+    def test_put_get(self, cache_path):
+        cache = LLMCache(path=cache_path, persist=False)
+        key = LLMCache.compute_key("p", b"i", "m")
+
+        assert cache.get(key) is None
+        assert cache.stats["misses"] == 1
+
+        cache.put(key, "response text")
+        assert cache.get(key) == "response text"
+        assert cache.stats["hits"] == 1
+
+    def test_lru_eviction(self, cache_path):
+        cache = LLMCache(max_size=2, path=cache_path, persist=False)
+        cache.put("a", "1")
+        cache.put("b", "2")
+
+        # Access "a" to make it more recent
+        cache.get("a")
+
+        # Adding "c" should evict "b" (least recently used)
+        cache.put("c", "3")
+        assert cache.get("a") == "1"
+        assert cache.get("b") is None
+        assert cache.get("c") == "3"
+
+    def test_persistence_round_trip(self, cache_path):
+        cache = LLMCache(path=cache_path, persist=False)
+        cache.put("k", "saved response")
+        cache.save()
+
+        reloaded = LLMCache(path=cache_path, persist=False)
+        reloaded._load()
+        assert reloaded.get("k") == "saved response"
+
+    def test_save_skips_when_clean(self, cache_path):
+        cache = LLMCache(path=cache_path, persist=False)
+        cache.save()
+        # Nothing was put, so nothing should have been written
+        import os
+        assert not os.path.exists(cache_path)
+
+    def test_corrupt_file_cold_start(self, cache_path):
+        with open(cache_path, "w") as f:
+            f.write("{not valid json")
+
+        cache = LLMCache(path=cache_path, persist=False)
+        cache._load()
+        assert cache.stats["size"] == 0
+
+        # Still fully usable after the failed load
+        cache.put("k", "v")
+        assert cache.get("k") == "v"
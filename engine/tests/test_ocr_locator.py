@@ -67,7 +67,7 @@ class TestOCRCache:
         assert ocr_cache.stats["hits"] == 1
 
     def test_lru_eviction(self):
-        cache = OCRCache(max_size=2)
+        cache = OCRCache(max_size=2, policy="lru")
 
         # Create 3 different images
         img1 = Image.new("RGB", (100, 100), color="red")
@@ -87,6 +87,48 @@ class TestOCRCache:
         assert cache.get(img2) is None  # Evicted
         assert cache.get(img3) is not None  # Newly added
 
+    def test_lfu_eviction(self):
+        cache = OCRCache(max_size=2, policy="lfu")
+
+        img1 = Image.new("RGB", (100, 100), color="red")
+        img2 = Image.new("RGB", (100, 100), color="green")
+        img3 = Image.new("RGB", (100, 100), color="blue")
+
+        cache.put(img1, {"id": 1}, ["one"])
+        cache.put(img2, {"id": 2}, ["two"])
+
+        # img2 is hit often, img1 only once - img1 is least frequent
+        # even though it was touched more recently
+        for _ in range(3):
+            cache.get(img2)
+        cache.get(img1)
+
+        cache.put(img3, {"id": 3}, ["three"])
+
+        assert cache.get(img1) is None  # Evicted (lowest count)
+        assert cache.get(img2) is not None
+        assert cache.get(img3) is not None
+
+    def test_lfu_counter_saturation(self):
+        cache = OCRCache(max_size=4, policy="lfu")
+
+        img1 = Image.new("RGB", (100, 100), color="red")
+        img2 = Image.new("RGB", (100, 100), color="green")
+        cache.put(img1, {"id": 1}, ["one"])
+        cache.put(img2, {"id": 2}, ["two"])
+
+        # Drive img1's counter to the saturation point; the next hit
+        # should halve every counter so stale popularity ages out
+        key1 = cache.compute_key(img1)
+        key2 = cache.compute_key(img2)
+        cache._counts[key1] = cache._COUNT_MAX - 1
+        cache._counts[key2] = 10
+
+        cache.get(img1)
+
+        assert cache._counts[key1] == cache._COUNT_MAX >> 1
+        assert cache._counts[key2] == 5
+
 
 class TestOCRLocator:
     """Tests for OCR locator."""
@@ -6,8 +6,12 @@ from engine.utils.retry import with_retry, RetryConfig
 from engine.utils.image import (
     draw_highlight,
     draw_bounding_box,
+    jpeg_part_for_api,
+    open_for_api,
+    phash,
     resize_for_api,
     take_screenshot,
+    take_screenshot_async,
 )
 
 __all__ = [
@@ -15,6 +19,10 @@ __all__ = [
     "RetryConfig",
     "draw_highlight",
     "draw_bounding_box",
+    "jpeg_part_for_api",
+    "open_for_api",
+    "phash",
     "resize_for_api",
     "take_screenshot",
+    "take_screenshot_async",
 ]
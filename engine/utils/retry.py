@@ -2,6 +2,9 @@
 Retry decorator with exponential backoff.
 """
 
+import asyncio
+import inspect
+import random
 import time
 import functools
 from dataclasses import dataclass
@@ -18,6 +21,19 @@ class RetryConfig:
     max_delay: float = 5.0
     exponential_base: float = 2.0
     retry_on: Tuple[Type[Exception], ...] = (Exception,)
+    # "full" (AWS full jitter), "equal" (half fixed, half random), or "none".
+    # Jitter de-synchronizes concurrent callers retrying after the same 429
+    # so they don't re-collide in lockstep.
+    jitter: str = "full"
+
+
+def _jittered(delay: float, jitter: str) -> float:
+    """Apply the configured jitter strategy to a backoff delay."""
+    if jitter == "full":
+        return random.uniform(0, delay)
+    if jitter == "equal":
+        return delay / 2 + random.uniform(0, delay / 2)
+    return delay
 
 
 T = TypeVar("T")
@@ -66,67 +82,87 @@ def with_retry(
 
 
 def _make_wrapper(func: Callable[..., T], config: RetryConfig) -> Callable[..., T]:
-    """Create the actual retry wrapper."""
+    """Create the actual retry wrapper (async-aware)."""
+
+    if inspect.iscoroutinefunction(func):
+        # Backoff waits yield the event loop instead of blocking the
+        # thread - concurrent OCR/locator work keeps running while a
+        # throttled API call sits out its delay
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+            # Hoist config fields out of the loop - attribute access per
+            # attempt is pure overhead on the hot no-failure path
+            max_attempts = config.max_attempts
+            retry_on = config.retry_on
+            last_exception = None
+            delay = config.base_delay
+
+            for attempt in range(1, max_attempts + 1):
+                try:
+                    return await func(*args, **kwargs)
+                except retry_on as e:
+                    last_exception = e
+
+                    if attempt == max_attempts:
+                        break
+
+                    await asyncio.sleep(_jittered(delay, config.jitter))
+                    delay = min(delay * config.exponential_base, config.max_delay)
+
+            raise RetryExhaustedError(
+                operation=func.__name__,
+                attempts=max_attempts,
+                last_error=last_exception,
+            )
+
+        return async_wrapper
 
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> T:
-        last_exception = None
-        delay = config.base_delay
-
-        for attempt in range(1, config.max_attempts + 1):
-            try:
-                return func(*args, **kwargs)
-            except config.retry_on as e:
-                last_exception = e
-
-                if attempt == config.max_attempts:
-                    break
-
-                # Sleep with exponential backoff
-                time.sleep(delay)
-                delay = min(delay * config.exponential_base, config.max_delay)
-
-        raise RetryExhaustedError(
-            operation=func.__name__,
-            attempts=config.max_attempts,
-            last_error=last_exception,
-        )
+        return _run_with_retry(func, args, kwargs, config)
 
     return wrapper
 
 
-def retry_call(
-    func: Callable[..., T],
-    args: tuple = (),
-    kwargs: Optional[dict] = None,
-    config: Optional[RetryConfig] = None,
+def _run_with_retry(
+    func: Callable[..., T], args: tuple, kwargs: dict, cfg: RetryConfig
 ) -> T:
-    """
-    Call a function with retry logic.
-
-    Alternative to decorator for one-off use:
-        result = retry_call(some_api_call, args=(param,), config=RetryConfig(max_attempts=5))
-    """
-    kwargs = kwargs or {}
-    cfg = config or RetryConfig()
-
+    """Single sync retry loop shared by the decorator and retry_call."""
+    max_attempts = cfg.max_attempts
+    retry_on = cfg.retry_on
     last_exception = None
     delay = cfg.base_delay
 
-    for attempt in range(1, cfg.max_attempts + 1):
+    for attempt in range(1, max_attempts + 1):
         try:
             return func(*args, **kwargs)
-        except cfg.retry_on as e:
+        except retry_on as e:
             last_exception = e
 
-            if attempt == cfg.max_attempts:
+            if attempt == max_attempts:
                 break
 
-            time.sleep(delay)
+            # Sleep with exponential backoff
+            time.sleep(_jittered(delay, cfg.jitter))
             delay = min(delay * cfg.exponential_base, cfg.max_delay)
 
     raise RetryExhaustedError(
         operation=func.__name__,
-        attempts=cfg.max_attempts,
+        attempts=max_attempts,
         last_error=last_exception,
     )
+
+
+def retry_call(
+    func: Callable[..., T],
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+    config: Optional[RetryConfig] = None,
+) -> T:
+    """
+    Call a function with retry logic.
+
+    Alternative to decorator for one-off use:
+        result = retry_call(some_api_call, args=(param,), config=RetryConfig(max_attempts=5))
+    """
+    return _run_with_retry(func, args, kwargs or {}, config or RetryConfig())